@@ -13,23 +13,56 @@ Since: v0.6
 """
 
 import argparse
+import array
+import atexit
 import json
 import os
+import pickle
+import re
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import statistics
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 # Default configuration
 DEFAULT_RESULTS_DIR = "benchmark-results"
 BACKENDS = ["inmemory", "neo4j", "pgsql", "pgage"]
 DATASETS = ["medical", "sap"]
 
+# Display names for the markdown report
+_BACKEND_DISPLAY_NAMES = {
+    'inmemory': 'In-Memory (JGraphT)',
+    'neo4j': 'Neo4j',
+    'pgsql': 'PostgreSQL (SQL)',
+    'pgage': 'PostgreSQL (Apache AGE)'
+}
 
-@dataclass
-class LatencyStats:
+
+class LatencyStats(NamedTuple):
     """Latency statistics from benchmark results."""
     min_ms: float
     max_ms: float
@@ -39,8 +72,7 @@ class LatencyStats:
     p99_ms: float
 
 
-@dataclass
-class ScenarioResult:
+class ScenarioResult(NamedTuple):
     """Result for a single benchmark scenario."""
     name: str
     iterations: int
@@ -50,9 +82,10 @@ class ScenarioResult:
     latency_overhead_ms: float
     latency_overhead_pct: float
     latency: LatencyStats
+    samples: Optional[np.ndarray] = None  # raw latency samples, if recorded
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Complete benchmark result from a backend."""
     backend: str
@@ -64,9 +97,14 @@ class BenchmarkResult:
     scenarios: List[ScenarioResult]
     avg_chunk_improvement: float
     avg_latency_overhead: float
+    # Columnar (SoA) copies of the per-scenario percentiles so downstream
+    # aggregation is a single C-level reduction per column
+    p50_arr: Optional[np.ndarray] = None
+    p95_arr: Optional[np.ndarray] = None
+    p99_arr: Optional[np.ndarray] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BackendComparison:
     """Comparison metrics across backends."""
     backend: str
@@ -79,7 +117,7 @@ class BackendComparison:
     total_duration: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationReport:
     """Complete evaluation report."""
     generated_at: str
@@ -91,36 +129,117 @@ class EvaluationReport:
     lowest_overhead: Dict[str, str]  # dataset -> backend
 
 
-def load_benchmark_result(filepath: Path) -> Optional[BenchmarkResult]:
-    """Load a benchmark result JSON file."""
+# Persistent parse cache keyed on (path, mtime_ns, size) so unchanged result
+# files skip the read + JSON parse + dataclass construction on repeated runs
+_CACHE_PATH = Path.home() / '.cache' / 'cef' / 'eval-cache-v4.pkl'
+try:
+    with open(_CACHE_PATH, 'rb') as _f:
+        _parse_cache = pickle.load(_f)
+except Exception:
+    # Unreadable or incompatible cache: start fresh, it will be rebuilt
+    _parse_cache = {}
+_parse_cache_dirty = False
+
+
+def _save_parse_cache():
+    if not _parse_cache_dirty:
+        return
     try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_CACHE_PATH, 'wb') as f:
+            pickle.dump(_parse_cache, f)
+    except Exception:
+        pass  # cache is best-effort only
+
+
+atexit.register(_save_parse_cache)
+
+
+# Result files above this size are stream-parsed instead of slurped whole
+_STREAM_THRESHOLD = 1 << 20
+
+
+def _read_result_document(filepath: Path, size: int):
+    """Return (top_level_fields, summary, scenario_iterable) for a result file.
+
+    Small files are slurped in one go (orjson when available); large ones are
+    stream-parsed with ijson so peak memory stays at one scenario record
+    instead of the whole document.
+    """
+    if HAS_IJSON and size >= _STREAM_THRESHOLD:
+        top: Dict = {}
+        summary: Dict = {}
+        with open(filepath, 'rb') as f:
+            # First pass: top-level scalars and the summary object only
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if event not in ('string', 'number', 'boolean'):
+                    continue
+                if prefix.startswith('summary.'):
+                    summary[prefix[len('summary.'):]] = value
+                elif '.' not in prefix:
+                    top[prefix] = value
+
+        def scenario_iter():
+            # Second pass: stream scenarios one record at a time
+            with open(filepath, 'rb') as f:
+                yield from ijson.items(f, 'scenarios.item', use_float=True)
+
+        return top, summary, scenario_iter()
+
+    # orjson parses several times faster than stdlib json when available
+    if HAS_ORJSON:
+        data = orjson.loads(filepath.read_bytes())
+    else:
         with open(filepath, 'r') as f:
             data = json.load(f)
-        
+    return data, data.get('summary', {}), data.get('scenarios', [])
+
+
+def load_benchmark_result(filepath: Path) -> Optional[BenchmarkResult]:
+    """Load a benchmark result JSON file."""
+    global _parse_cache_dirty
+    try:
+        st = os.stat(filepath)
+        cache_key = (str(filepath), st.st_mtime_ns, st.st_size)
+        cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        data, summary, scenario_docs = _read_result_document(filepath, st.st_size)
+
         scenarios = []
-        for s in data.get('scenarios', []):
+        p50_col = array.array('d')
+        p95_col = array.array('d')
+        p99_col = array.array('d')
+        for s in scenario_docs:
             latency_data = s.get('latency', {})
+            # Positional NamedTuple construction: C-level tuple allocation,
+            # no keyword-argument dispatch on the hot path
             latency = LatencyStats(
-                min_ms=latency_data.get('minMs', 0),
-                max_ms=latency_data.get('maxMs', 0),
-                mean_ms=latency_data.get('meanMs', 0),
-                p50_ms=latency_data.get('p50Ms', 0),
-                p95_ms=latency_data.get('p95Ms', 0),
-                p99_ms=latency_data.get('p99Ms', 0)
+                latency_data.get('minMs', 0),
+                latency_data.get('maxMs', 0),
+                latency_data.get('meanMs', 0),
+                latency_data.get('p50Ms', 0),
+                latency_data.get('p95Ms', 0),
+                latency_data.get('p99Ms', 0)
             )
+            p50_col.append(latency.p50_ms)
+            p95_col.append(latency.p95_ms)
+            p99_col.append(latency.p99_ms)
+            raw_samples = latency_data.get('samples')
             scenarios.append(ScenarioResult(
-                name=s.get('name', ''),
-                iterations=s.get('iterations', 0),
-                baseline_chunks=s.get('baselineChunks', 0),
-                cef_chunks=s.get('cefChunks', 0),
-                chunk_improvement_pct=s.get('chunkImprovementPct', 0),
-                latency_overhead_ms=s.get('latencyOverheadMs', 0),
-                latency_overhead_pct=s.get('latencyOverheadPct', 0),
-                latency=latency
+                s.get('name', ''),
+                s.get('iterations', 0),
+                s.get('baselineChunks', 0),
+                s.get('cefChunks', 0),
+                s.get('chunkImprovementPct', 0),
+                s.get('latencyOverheadMs', 0),
+                s.get('latencyOverheadPct', 0),
+                latency,
+                np.asarray(raw_samples, dtype=np.float64) if raw_samples else None
             ))
         
-        summary = data.get('summary', {})
-        return BenchmarkResult(
+        result = BenchmarkResult(
             backend=data.get('backend', ''),
             dataset=data.get('dataset', ''),
             timestamp=data.get('timestamp', ''),
@@ -129,40 +248,88 @@ def load_benchmark_result(filepath: Path) -> Optional[BenchmarkResult]:
             graph_build_time_ms=data.get('graphBuildTimeMs', 0),
             scenarios=scenarios,
             avg_chunk_improvement=summary.get('avgChunkImprovement', 0),
-            avg_latency_overhead=summary.get('avgLatencyOverhead', 0)
+            avg_latency_overhead=summary.get('avgLatencyOverhead', 0),
+            p50_arr=np.asarray(p50_col, dtype=np.float64),
+            p95_arr=np.asarray(p95_col, dtype=np.float64),
+            p99_arr=np.asarray(p99_col, dtype=np.float64)
         )
+        _parse_cache[cache_key] = result
+        _parse_cache_dirty = True
+        return result
     except Exception as e:
         print(f"Warning: Failed to load {filepath}: {e}")
         return None
 
 
+# Run timestamp embedded in result filenames ({backend}_{dataset}_{TIMESTAMP}.json);
+# it sorts lexicographically, so recency needs no filesystem metadata at all
+_TS_RE = re.compile(r'_(\d{8}[_T-]?\d{6})\.json$')
+
+
 def discover_results(results_dir: Path) -> Dict[str, Dict[str, BenchmarkResult]]:
     """
     Discover and load all benchmark results.
     Returns: {backend: {dataset: BenchmarkResult}}
     """
     results: Dict[str, Dict[str, BenchmarkResult]] = {}
-    
+
+    # Cheap synchronous pass: resolve the most recent file per combination
+    tasks: List[Tuple[str, str, Path]] = []
     for backend in BACKENDS:
         backend_dir = results_dir / backend
         if not backend_dir.exists():
             continue
-        
+
         results[backend] = {}
+        # One scandir pass classifies every file into its dataset bucket.
+        # Recency comes from the filename timestamp when present (zero
+        # syscalls); entries without one fall back to DirEntry.stat(),
+        # which reuses the metadata the scandir call already fetched
+        prefixes = [(dataset, f"{backend}_{dataset}_") for dataset in DATASETS]
+        buckets: Dict[str, List[Tuple[str, Tuple]]] = {d: [] for d in DATASETS}
+        with os.scandir(backend_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json'):
+                    continue
+                for dataset, prefix in prefixes:
+                    if entry.name.startswith(prefix):
+                        ts = _TS_RE.search(entry.name)
+                        key = (1, ts.group(1)) if ts else (0, entry.stat().st_mtime)
+                        buckets[dataset].append((entry.path, key))
+                        break
+
         for dataset in DATASETS:
-            # Look for most recent result file
-            pattern = f"{backend}_{dataset}_*.json"
-            files = list(backend_dir.glob(pattern))
-            if files:
-                # Sort by modification time, get most recent
-                most_recent = max(files, key=lambda p: p.stat().st_mtime)
-                result = load_benchmark_result(most_recent)
-                if result:
-                    results[backend][dataset] = result
-    
+            bucket = buckets[dataset]
+            if bucket:
+                most_recent = max(bucket, key=itemgetter(1))[0]
+                tasks.append((backend, dataset, Path(most_recent)))
+
+    if not tasks:
+        return results
+
+    # Loading is I/O-bound and embarrassingly parallel: the blocking reads
+    # overlap across threads (orjson also releases the GIL while parsing)
+    with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as executor:
+        loaded = list(executor.map(load_benchmark_result, (t[2] for t in tasks)))
+
+    for (backend, dataset, _), result in zip(tasks, loaded):
+        if result:
+            results[backend][dataset] = result
+
     return results
 
 
+def _mean_reduce(p50: np.ndarray, p95: np.ndarray, p99: np.ndarray):
+    """Reduce the three percentile columns to their means in one call."""
+    return p50.mean(), p95.mean(), p99.mean()
+
+
+if HAS_NUMBA:
+    # JIT the reduction for large sweep runs; cache=True avoids paying the
+    # compile cost on every invocation
+    _mean_reduce = numba.njit(cache=True, fastmath=True)(_mean_reduce)
+
+
 def compute_comparison(result: BenchmarkResult) -> BackendComparison:
     """Compute comparison metrics from a benchmark result."""
     if not result.scenarios:
@@ -177,16 +344,24 @@ def compute_comparison(result: BenchmarkResult) -> BackendComparison:
             total_duration=result.total_duration_ms
         )
     
-    p50_values = [s.latency.p50_ms for s in result.scenarios]
-    p95_values = [s.latency.p95_ms for s in result.scenarios]
-    p99_values = [s.latency.p99_ms for s in result.scenarios]
-    
+    if all(s.samples is not None for s in result.scenarios):
+        # Preferred path: true percentiles over the pooled raw samples in one
+        # C-level selection pass (averaging per-scenario percentiles is
+        # statistically wrong)
+        all_samples = np.concatenate([s.samples for s in result.scenarios])
+        avg_p50, avg_p95, avg_p99 = np.percentile(all_samples, [50, 95, 99])
+    else:
+        # Fallback for results without raw samples: reduce the columnar
+        # percentile arrays built at load time, no Python iteration
+        avg_p50, avg_p95, avg_p99 = _mean_reduce(
+            result.p50_arr, result.p95_arr, result.p99_arr)
+
     return BackendComparison(
         backend=result.backend,
         dataset=result.dataset,
-        avg_latency_p50=statistics.mean(p50_values),
-        avg_latency_p95=statistics.mean(p95_values),
-        avg_latency_p99=statistics.mean(p99_values),
+        avg_latency_p50=float(avg_p50),
+        avg_latency_p95=float(avg_p95),
+        avg_latency_p99=float(avg_p99),
         avg_chunk_improvement=result.avg_chunk_improvement,
         avg_latency_overhead_pct=result.avg_latency_overhead,
         total_duration=result.total_duration_ms
@@ -196,32 +371,33 @@ def compute_comparison(result: BenchmarkResult) -> BackendComparison:
 def generate_evaluation_report(results: Dict[str, Dict[str, BenchmarkResult]]) -> EvaluationReport:
     """Generate evaluation report from all benchmark results."""
     comparisons: List[BackendComparison] = []
-    
-    # Compute comparisons for all backend/dataset combinations
+
+    # Per-dataset running bests, updated while the comparisons are computed
+    # so the results are traversed exactly once:
+    # fastest = lowest P50, best improvement = highest percentage,
+    # lowest overhead = lowest latency overhead percentage
+    best_lat: Dict[str, BackendComparison] = {}
+    best_imp: Dict[str, BackendComparison] = {}
+    best_ovh: Dict[str, BackendComparison] = {}
+
     for backend, datasets in results.items():
         for dataset, result in datasets.items():
-            comparison = compute_comparison(result)
-            comparisons.append(comparison)
-    
-    # Find winners for each metric per dataset
-    fastest_backend: Dict[str, str] = {}
-    best_chunk_improvement: Dict[str, str] = {}
-    lowest_overhead: Dict[str, str] = {}
-    
-    for dataset in DATASETS:
-        dataset_comparisons = [c for c in comparisons if c.dataset == dataset]
-        if dataset_comparisons:
-            # Fastest = lowest P50 latency
-            fastest = min(dataset_comparisons, key=lambda c: c.avg_latency_p50)
-            fastest_backend[dataset] = fastest.backend
-            
-            # Best chunk improvement = highest improvement percentage
-            best_improvement = max(dataset_comparisons, key=lambda c: c.avg_chunk_improvement)
-            best_chunk_improvement[dataset] = best_improvement.backend
-            
-            # Lowest overhead = lowest latency overhead percentage
-            lowest = min(dataset_comparisons, key=lambda c: c.avg_latency_overhead_pct)
-            lowest_overhead[dataset] = lowest.backend
+            c = compute_comparison(result)
+            comparisons.append(c)
+
+            cur = best_lat.get(dataset)
+            if cur is None or c.avg_latency_p50 < cur.avg_latency_p50:
+                best_lat[dataset] = c
+            cur = best_imp.get(dataset)
+            if cur is None or c.avg_chunk_improvement > cur.avg_chunk_improvement:
+                best_imp[dataset] = c
+            cur = best_ovh.get(dataset)
+            if cur is None or c.avg_latency_overhead_pct < cur.avg_latency_overhead_pct:
+                best_ovh[dataset] = c
+
+    fastest_backend = {d: best_lat[d].backend for d in DATASETS if d in best_lat}
+    best_chunk_improvement = {d: best_imp[d].backend for d in DATASETS if d in best_imp}
+    lowest_overhead = {d: best_ovh[d].backend for d in DATASETS if d in best_ovh}
     
     return EvaluationReport(
         generated_at=datetime.now().isoformat(),
@@ -236,39 +412,39 @@ def generate_evaluation_report(results: Dict[str, Dict[str, BenchmarkResult]]) -
 
 def print_report(report: EvaluationReport):
     """Print evaluation report to console."""
-    print("\n" + "=" * 80)
-    print("CEF BENCHMARK EVALUATION REPORT")
-    print("=" * 80)
-    print(f"Generated: {report.generated_at}")
-    print(f"Backends: {', '.join(report.backends_evaluated)}")
-    print(f"Datasets: {', '.join(report.datasets_evaluated)}")
-    print()
-    
+    # Write straight to stdout instead of one print (and flush) per line
+    w = sys.stdout.write
+    w("\n" + "=" * 80 + "\n")
+    w("CEF BENCHMARK EVALUATION REPORT\n")
+    w("=" * 80 + "\n")
+    w(f"Generated: {report.generated_at}\n")
+    w(f"Backends: {', '.join(report.backends_evaluated)}\n")
+    w(f"Datasets: {', '.join(report.datasets_evaluated)}\n\n")
+
     # Print comparison table
-    print("-" * 80)
-    print(f"{'Backend':<12} {'Dataset':<10} {'P50 (ms)':<12} {'P95 (ms)':<12} {'Chunk Imp%':<12} {'Overhead%':<12}")
-    print("-" * 80)
-    
+    w("-" * 80 + "\n")
+    w(f"{'Backend':<12} {'Dataset':<10} {'P50 (ms)':<12} {'P95 (ms)':<12} {'Chunk Imp%':<12} {'Overhead%':<12}\n")
+    w("-" * 80 + "\n")
+
     for c in report.comparisons:
-        print(f"{c.backend:<12} {c.dataset:<10} {c.avg_latency_p50:<12.2f} {c.avg_latency_p95:<12.2f} "
-              f"{c.avg_chunk_improvement:<12.1f} {c.avg_latency_overhead_pct:<12.1f}")
-    
-    print("-" * 80)
-    print()
-    
+        w(f"{c.backend:<12} {c.dataset:<10} {c.avg_latency_p50:<12.2f} {c.avg_latency_p95:<12.2f} "
+          f"{c.avg_chunk_improvement:<12.1f} {c.avg_latency_overhead_pct:<12.1f}\n")
+
+    w("-" * 80 + "\n\n")
+
     # Print winners
-    print("WINNERS BY DATASET:")
-    print("-" * 40)
+    w("WINNERS BY DATASET:\n")
+    w("-" * 40 + "\n")
     for dataset in report.datasets_evaluated:
-        print(f"\n{dataset.upper()} Dataset:")
+        w(f"\n{dataset.upper()} Dataset:\n")
         if dataset in report.fastest_backend:
-            print(f"  🏆 Fastest (P50):       {report.fastest_backend[dataset]}")
+            w(f"  🏆 Fastest (P50):       {report.fastest_backend[dataset]}\n")
         if dataset in report.best_chunk_improvement:
-            print(f"  🏆 Best Chunk Savings:  {report.best_chunk_improvement[dataset]}")
+            w(f"  🏆 Best Chunk Savings:  {report.best_chunk_improvement[dataset]}\n")
         if dataset in report.lowest_overhead:
-            print(f"  🏆 Lowest Overhead:     {report.lowest_overhead[dataset]}")
-    
-    print("\n" + "=" * 80)
+            w(f"  🏆 Lowest Overhead:     {report.lowest_overhead[dataset]}\n")
+
+    w("\n" + "=" * 80 + "\n")
 
 
 def save_report(report: EvaluationReport, output_path: Path):
@@ -297,87 +473,75 @@ def save_report(report: EvaluationReport, output_path: Path):
         }
     }
     
-    with open(output_path, 'w') as f:
-        json.dump(report_dict, f, indent=2)
-    
+    if HAS_ORJSON:
+        output_path.write_bytes(orjson.dumps(report_dict, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(report_dict, f, indent=2)
+
     print(f"Report saved to: {output_path}")
 
 
 def generate_markdown_report(report: EvaluationReport, output_path: Path):
     """Generate Markdown report for documentation."""
-    lines = [
-        "# CEF Benchmark Evaluation Report",
-        "",
-        f"**Generated:** {report.generated_at}",
-        "",
-        "## Executive Summary",
-        "",
-        "This report compares CEF (Context Engineering Framework) performance across multiple graph store backends.",
-        "",
-        "### Backends Evaluated",
-        "",
-    ]
-    
-    for backend in report.backends_evaluated:
-        backend_names = {
-            'inmemory': 'In-Memory (JGraphT)',
-            'neo4j': 'Neo4j',
-            'pgsql': 'PostgreSQL (SQL)',
-            'pgage': 'PostgreSQL (Apache AGE)'
-        }
-        lines.append(f"- **{backend}**: {backend_names.get(backend, backend)}")
-    
-    lines.extend([
-        "",
-        "## Performance Comparison",
-        "",
-        "### Latency Metrics",
-        "",
-        "| Backend | Dataset | P50 (ms) | P95 (ms) | P99 (ms) | Chunk Improvement | Latency Overhead |",
-        "|---------|---------|----------|----------|----------|-------------------|------------------|",
-    ])
-    
-    for c in report.comparisons:
-        lines.append(
-            f"| {c.backend} | {c.dataset} | {c.avg_latency_p50:.2f} | {c.avg_latency_p95:.2f} | "
-            f"{c.avg_latency_p99:.2f} | {c.avg_chunk_improvement:.1f}% | {c.avg_latency_overhead_pct:.1f}% |"
-        )
-    
-    lines.extend([
-        "",
-        "## Winners by Dataset",
-        "",
-    ])
-    
-    for dataset in report.datasets_evaluated:
-        lines.append(f"### {dataset.title()} Dataset")
-        lines.append("")
-        if dataset in report.fastest_backend:
-            lines.append(f"- **Fastest (P50 Latency):** {report.fastest_backend[dataset]}")
-        if dataset in report.best_chunk_improvement:
-            lines.append(f"- **Best Chunk Savings:** {report.best_chunk_improvement[dataset]}")
-        if dataset in report.lowest_overhead:
-            lines.append(f"- **Lowest Overhead:** {report.lowest_overhead[dataset]}")
-        lines.append("")
-    
-    lines.extend([
-        "## Recommendations",
-        "",
-        "Based on the benchmark results:",
-        "",
-        "1. **Development/Testing:** Use `inmemory` backend for fastest iteration",
-        "2. **Production with Simple Graphs:** Consider `pgsql` for SQL-native environments",
-        "3. **Production with Complex Graphs:** Use `neo4j` or `pgage` for graph traversal",
-        "4. **Hybrid Workloads:** `pgage` provides both SQL and Cypher query capabilities",
-        "",
-        "---",
-        "",
-        f"*Report generated by CEF Benchmark Evaluation v0.6*",
-    ])
-    
-    with open(output_path, 'w') as f:
-        f.write('\n'.join(lines))
-    
+    # Stream straight into the (buffered) file handle instead of building a
+    # large list of lines plus the joined copy of the whole body
+    with output_path.open('w', buffering=1 << 16) as f:
+        w = f.write
+        w("# CEF Benchmark Evaluation Report\n")
+        w("\n")
+        w(f"**Generated:** {report.generated_at}\n")
+        w("\n")
+        w("## Executive Summary\n")
+        w("\n")
+        w("This report compares CEF (Context Engineering Framework) performance across multiple graph store backends.\n")
+        w("\n")
+        w("### Backends Evaluated\n")
+        w("\n")
+
+        for backend in report.backends_evaluated:
+            w(f"- **{backend}**: {_BACKEND_DISPLAY_NAMES.get(backend, backend)}\n")
+
+        w("\n")
+        w("## Performance Comparison\n")
+        w("\n")
+        w("### Latency Metrics\n")
+        w("\n")
+        w("| Backend | Dataset | P50 (ms) | P95 (ms) | P99 (ms) | Chunk Improvement | Latency Overhead |\n")
+        w("|---------|---------|----------|----------|----------|-------------------|------------------|\n")
+
+        for c in report.comparisons:
+            w(f"| {c.backend} | {c.dataset} | {c.avg_latency_p50:.2f} | {c.avg_latency_p95:.2f} | "
+              f"{c.avg_latency_p99:.2f} | {c.avg_chunk_improvement:.1f}% | {c.avg_latency_overhead_pct:.1f}% |\n")
+
+        w("\n")
+        w("## Winners by Dataset\n")
+        w("\n")
+
+        for dataset in report.datasets_evaluated:
+            w(f"### {dataset.title()} Dataset\n")
+            w("\n")
+            if dataset in report.fastest_backend:
+                w(f"- **Fastest (P50 Latency):** {report.fastest_backend[dataset]}\n")
+            if dataset in report.best_chunk_improvement:
+                w(f"- **Best Chunk Savings:** {report.best_chunk_improvement[dataset]}\n")
+            if dataset in report.lowest_overhead:
+                w(f"- **Lowest Overhead:** {report.lowest_overhead[dataset]}\n")
+            w("\n")
+
+        w("## Recommendations\n")
+        w("\n")
+        w("Based on the benchmark results:\n")
+        w("\n")
+        w("1. **Development/Testing:** Use `inmemory` backend for fastest iteration\n")
+        w("2. **Production with Simple Graphs:** Consider `pgsql` for SQL-native environments\n")
+        w("3. **Production with Complex Graphs:** Use `neo4j` or `pgage` for graph traversal\n")
+        w("4. **Hybrid Workloads:** `pgage` provides both SQL and Cypher query capabilities\n")
+        w("\n")
+        w("---\n")
+        w("\n")
+        w("*Report generated by CEF Benchmark Evaluation v0.6*")
+
     print(f"Markdown report saved to: {output_path}")
 
 
@@ -1,21 +1,28 @@
 #!/usr/bin/env python3
+import matplotlib
+matplotlib.use('Agg')  # headless: skip GUI toolkit init, we only write a PNG
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Speed up the dpi=300 raster path
+plt.rcParams['figure.max_open_warning'] = 0
+plt.rcParams['path.simplify'] = True
+plt.rcParams['agg.path.chunksize'] = 10000
+
 # Data from SAP_BENCHMARK_REPORT.md
 scenarios = [
     'Scenario 1:\nCross-Project\nResource\nAllocation',
     'Scenario 2:\nCost Center\nContagion\nAnalysis'
 ]
 
-vector_chunks = [5, 5]
-km_chunks = [8, 8]
-vector_latency = [51, 18]
-km_latency = [56, 29]
+vector_chunks = np.array([5, 5])
+km_chunks = np.array([8, 8])
+vector_latency = np.array([51, 18])
+km_latency = np.array([56, 29])
 
-# Calculate improvements
-chunk_improvement = [(km - vec) / vec * 100 for vec, km in zip(vector_chunks, km_chunks)]
-avg_chunk_improvement = sum(chunk_improvement) / len(chunk_improvement)
+# Calculate improvements (vectorized instead of per-scenario Python loops)
+chunk_improvement = (km_chunks - vector_chunks) / vector_chunks * 100
+avg_chunk_improvement = chunk_improvement.mean()
 
 # Create figure with 2 subplots
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
@@ -29,13 +36,9 @@ bars1 = ax1.bar(x - width/2, vector_chunks, width, label='Vector-Only (Naive RAG
 bars2 = ax1.bar(x + width/2, km_chunks, width, label='Knowledge Model (Graph RAG)', 
                 color='#4ecdc4', alpha=0.8)
 
-# Add value labels on bars
-for bars in [bars1, bars2]:
-    for bar in bars:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}',
-                ha='center', va='bottom', fontweight='bold', fontsize=10)
+# Add value labels on bars (batched placement instead of per-bar ax.text)
+ax1.bar_label(bars1, fmt='%d', padding=2, fontweight='bold', fontsize=10)
+ax1.bar_label(bars2, fmt='%d', padding=2, fontweight='bold', fontsize=10)
 
 # Add improvement percentages
 for i, (vec, km) in enumerate(zip(vector_chunks, km_chunks)):
@@ -60,12 +63,8 @@ bars4 = ax2.bar(x + width/2, km_latency, width, label='Knowledge Model',
                 color='#4ecdc4', alpha=0.8)
 
 # Add value labels
-for bars in [bars3, bars4]:
-    for bar in bars:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}ms',
-                ha='center', va='bottom', fontweight='bold', fontsize=9)
+ax2.bar_label(bars3, fmt='%dms', padding=2, fontweight='bold', fontsize=9)
+ax2.bar_label(bars4, fmt='%dms', padding=2, fontweight='bold', fontsize=9)
 
 ax2.set_xlabel('SAP ERP Scenarios', fontsize=12, fontweight='bold')
 ax2.set_ylabel('Latency (milliseconds)', fontsize=12, fontweight='bold')
@@ -89,8 +88,8 @@ print(f"\nAverage Chunk Improvement: +{avg_chunk_improvement:.1f}%")
 print(f"  - Scenario 1 (Resource Allocation): +{chunk_improvement[0]:.0f}% more chunks (5 → 8)")
 print(f"  - Scenario 2 (Contagion Analysis): +{chunk_improvement[1]:.0f}% more chunks (5 → 8)")
 
-avg_vector_latency = sum(vector_latency) / len(vector_latency)
-avg_km_latency = sum(km_latency) / len(km_latency)
+avg_vector_latency = vector_latency.mean()
+avg_km_latency = km_latency.mean()
 latency_overhead = ((avg_km_latency - avg_vector_latency) / avg_vector_latency) * 100
 
 print(f"\nAverage Latency:")
@@ -1,70 +1,165 @@
+import hashlib
+import inspect
 import json
+import mmap
+import os
+import pickle
 import re
+import matplotlib
+matplotlib.use('Agg')  # headless: skip GUI toolkit init, we only write a PNG
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from collections import defaultdict
+from pathlib import Path
 from typing import Set, List, Dict
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# The only node properties ground-truth logic ever reads
+_NODE_PROPS = ('patient_id', 'name', 'smoking_status')
+
+# Relation types interned to small ints: adjacency entries hold two machine
+# ints instead of two 36-char UUID strings plus a relation string
+REL_TREATED_BY, REL_HAS_CONDITION, REL_PRESCRIBED, REL_CONTRAINDICATED = range(4)
+REL_IDS = {
+    'TREATED_BY': REL_TREATED_BY,
+    'HAS_CONDITION': REL_HAS_CONDITION,
+    'PRESCRIBED_MEDICATION': REL_PRESCRIBED,
+    'CONTRAINDICATED_FOR': REL_CONTRAINDICATED,
+}
+
 # 1. Load Data and Build Graph
 def load_graph(json_path):
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-    
-    nodes = {n['id']: n for n in data['nodes']}
-    edges = data['edges']
-    
-    # Helper maps
-    patient_id_map = {n['properties'].get('patient_id'): n['id'] for n in nodes.values() if n['label'] == 'Patient'}
+    nodes = []
+    uuid_to_iid = {}
+    name_to_id = {}
+    patient_id_map = {}
+    adj = []
+    radj = []
+    adj_by_rel = defaultdict(lambda: defaultdict(list))
+    by_rel = defaultdict(list)
+    doc_to_patients = defaultdict(list)
+    cond_to_patients = defaultdict(list)
+
+    def add_node(n):
+        label, props = n['label'], n['properties']
+        # Dense int id per node; UUID strings survive only in uuid_to_iid
+        iid = len(nodes)
+        uuid_to_iid[n['id']] = iid
+        # Keep only the fields ground truth actually reads, not the raw dict
+        nodes.append({'id': iid, 'label': label,
+                      'properties': {k: props[k] for k in _NODE_PROPS if k in props}})
+        if label == 'Patient':
+            patient_id_map[props.get('patient_id')] = iid
+        if 'name' in props:
+            name_to_id[props['name']] = iid
+        adj.append([])
+        radj.append([])
+
+    # Forward + reverse adjacency and a per-relation edge index, all built
+    # as edges parse so scenario code never rescans (or even keeps) the edge list
+    def add_edge(e):
+        src = uuid_to_iid[e['sourceNodeId']]
+        tgt = uuid_to_iid[e['targetNodeId']]
+        rel = REL_IDS.setdefault(e['relationType'], len(REL_IDS))
+        adj[src].append((tgt, rel))
+        radj[tgt].append((src, rel))
+        adj_by_rel[rel][src].append(tgt)
+        by_rel[rel].append((src, tgt))
+        if rel == REL_TREATED_BY:
+            doc_to_patients[tgt].append(src)
+        elif rel == REL_HAS_CONDITION:
+            cond_to_patients[tgt].append(src)
+
+    if HAS_IJSON:
+        # Stream the JSON: each record is reduced into the indexes and
+        # dropped, so the full parsed tree never lives in memory at once
+        with open(json_path, 'rb') as f:
+            for n in ijson.items(f, 'nodes.item'):
+                add_node(n)
+        with open(json_path, 'rb') as f:
+            for e in ijson.items(f, 'edges.item'):
+                add_edge(e)
+    else:
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
+        for n in data['nodes']:
+            add_node(n)
+        for e in data['edges']:
+            add_edge(e)
+
     reverse_patient_id_map = {v: k for k, v in patient_id_map.items()}
-    
-    # Adjacency list
-    adj = {n: [] for n in nodes}
-    for e in edges:
-        adj[e['sourceNodeId']].append((e['targetNodeId'], e['relationType']))
-        # We might need reverse edges for some traversals
-    
-    return nodes, edges, adj, patient_id_map, reverse_patient_id_map
+
+    return (nodes, adj, radj, adj_by_rel, by_rel, doc_to_patients, cond_to_patients,
+            name_to_id, patient_id_map, reverse_patient_id_map, uuid_to_iid)
 
 # 2. Ground Truth Logic
-def get_ground_truth(nodes, edges, adj, patient_id_map, reverse_patient_id_map):
+def get_ground_truth(nodes, adj, radj, adj_by_rel, by_rel, doc_to_patients, cond_to_patients,
+                     name_to_id, patient_id_map, reverse_patient_id_map, uuid_to_iid):
     gt = {}
-    
+
+    # Dense bit assignments per node class: membership tests below become a
+    # single AND on a machine-word int instead of hashing 36-char UUIDs
+    med_bit = {n['id']: 1 << i for i, n in enumerate(n for n in nodes if n['label'] == 'Medication')}
+    cond_bit = {n['id']: 1 << i for i, n in enumerate(n for n in nodes if n['label'] == 'Condition')}
+
+    # One pass per patient over the pre-split sub-adjacencies: collect
+    # med/condition bitmasks and doctors with no relation compare at all
+    med_adj = adj_by_rel[REL_PRESCRIBED]
+    cond_adj = adj_by_rel[REL_HAS_CONDITION]
+    doc_adj = adj_by_rel[REL_TREATED_BY]
+
+    patient_med_mask = {}
+    patient_cond_mask = {}
+    patient_docs = {}
+    for pid, uuid in patient_id_map.items():
+        mmask, cmask = 0, 0
+        for target in med_adj.get(uuid, ()):
+            mmask |= med_bit[target]
+        for target in cond_adj.get(uuid, ()):
+            cmask |= cond_bit[target]
+        patient_med_mask[uuid] = mmask
+        patient_cond_mask[uuid] = cmask
+        patient_docs[uuid] = frozenset(doc_adj.get(uuid, ()))
+
     # Scenario 1: Patient Zero (Same doctor as PT-10001)
     # PT-10001 -> TREATED_BY -> DOC -> TREATED_BY (reverse) -> Patients
     pt_10001_uuid = patient_id_map['PT-10001']
-    doctors = [target for target, rel in adj[pt_10001_uuid] if rel == 'TREATED_BY']
-    
-    # Find all patients treated by these doctors
-    # Since edges are directed Patient -> Doctor, we need to scan edges or build reverse index
-    doc_patients = set()
-    for e in edges:
-        if e['relationType'] == 'TREATED_BY' and e['targetNodeId'] in doctors:
-            if e['sourceNodeId'] != pt_10001_uuid: # Exclude self? Usually yes.
-                doc_patients.add(reverse_patient_id_map.get(e['sourceNodeId']))
-    
+    doctors = patient_docs[pt_10001_uuid]
+
+    # Find all patients treated by these doctors. The doctor index is
+    # patient-only, so no relation filter and no .get(None) fallback needed.
+    doc_patients = {reverse_patient_id_map[src]
+                    for doc in doctors
+                    for src in doc_to_patients.get(doc, ())
+                    if src != pt_10001_uuid} # Exclude self? Usually yes.
+
     gt['Multi-Hop Contraindication Discovery'] = doc_patients
     gt['Patient Zero'] = doc_patients  # Alias for compatibility
-    
+
     # Scenario 2: Contraindications
-    # Find (M)-[:CONTRAINDICATED_FOR]->(C)
-    contraindications = []
-    for e in edges:
-        if e['relationType'] == 'CONTRAINDICATED_FOR':
-            contraindications.append((e['sourceNodeId'], e['targetNodeId'])) # Med, Condition
-            
+    # (M)-[:CONTRAINDICATED_FOR]->(C) pairs straight from the relation index
+    contraindications = [(med_bit[med], cond_bit[cond]) for med, cond in by_rel[REL_CONTRAINDICATED]] # Med, Condition
+
     contra_patients = set()
     for pid, uuid in patient_id_map.items():
-        # Get patient's meds and conditions
-        p_meds = set()
-        p_conds = set()
-        for target, rel in adj[uuid]:
-            if rel == 'PRESCRIBED_MEDICATION':
-                p_meds.add(target)
-            elif rel == 'HAS_CONDITION':
-                p_conds.add(target)
-        
+        mmask = patient_med_mask[uuid]
+        cmask = patient_cond_mask[uuid]
+
         # Check for conflict
-        for med, cond in contraindications:
-            if med in p_meds and cond in p_conds:
+        for mb, cb in contraindications:
+            if mmask & mb and cmask & cb:
                 contra_patients.add(pid)
                 
     gt['Contraindications'] = contra_patients  # Alias
@@ -72,7 +167,8 @@ def get_ground_truth(nodes, edges, adj, patient_id_map, reverse_patient_id_map):
 
     # Scenario 3: Smokers with Asthma
     # Asthma Node ID
-    asthma_id = next(n['id'] for n in nodes.values() if n['properties'].get('name') == 'Bronchial Asthma')
+    asthma_id = name_to_id['Bronchial Asthma']
+    asthma_bit = cond_bit[asthma_id]
     
     smoker_asthma_patients = set()
     for pid, uuid in patient_id_map.items():
@@ -81,14 +177,8 @@ def get_ground_truth(nodes, edges, adj, patient_id_map, reverse_patient_id_map):
         is_smoker = "Smoker" in smoking_status and "Never" not in smoking_status and "Former" not in smoking_status
         # Or strictly "Current Smoker"
         is_current_smoker = "Current Smoker" in smoking_status
-        
-        has_asthma = False
-        for target, rel in adj[uuid]:
-            if rel == 'HAS_CONDITION' and target == asthma_id:
-                has_asthma = True
-                break
-        
-        if is_current_smoker and has_asthma:
+
+        if is_current_smoker and patient_cond_mask[uuid] & asthma_bit:
             smoker_asthma_patients.add(pid)
             
     gt['Smokers with Asthma'] = smoker_asthma_patients  # Alias
@@ -99,40 +189,35 @@ def get_ground_truth(nodes, edges, adj, patient_id_map, reverse_patient_id_map):
     # Albuterol Node ID: 27380cec-996c-4233-b14d-c06d72a9392a
     ra_id = "e5581355-937b-40db-ab3f-034cd9e0ebfa"
     albuterol_id = "27380cec-996c-4233-b14d-c06d72a9392a"
-    
+
+    # The bit maps are keyed by dense int ids, so translate the UUID
+    # constants through uuid_to_iid first; an ID absent from this dataset
+    # resolves to None and .get with a zero bit then matches no patient
+    ra_iid = uuid_to_iid.get(ra_id)
+    albuterol_iid = uuid_to_iid.get(albuterol_id)
+    ra_bit = cond_bit.get(ra_iid, 0)
+    albuterol_bit = med_bit.get(albuterol_iid, 0)
+
     intersection_patients = set()
     for pid, uuid in patient_id_map.items():
-        has_ra = False
-        has_albuterol = False
-        for target, rel in adj[uuid]:
-            if rel == 'HAS_CONDITION' and target == ra_id:
-                has_ra = True
-            if rel == 'PRESCRIBED_MEDICATION' and target == albuterol_id:
-                has_albuterol = True
-        
-        if has_ra and has_albuterol:
+        if patient_cond_mask[uuid] & ra_bit and patient_med_mask[uuid] & albuterol_bit:
             intersection_patients.add(pid)
             
     gt['Intersection'] = intersection_patients  # Alias
     gt['Transitive Exposure Risk'] = intersection_patients  # May need different logic
 
     # Scenario 5: Root Cause Analysis (Prednisone + Type 2 Diabetes)
-    # Prednisone ID: Find by name
-    # Diabetes ID: Find by name
-    prednisone_id = next(n['id'] for n in nodes.values() if n['properties'].get('name') == 'Prednisone')
-    diabetes_id = next(n['id'] for n in nodes.values() if n['properties'].get('name') == 'Type 2 Diabetes Mellitus')
+    # Prednisone ID: Look up by name
+    # Diabetes ID: Look up by name
+    prednisone_id = name_to_id['Prednisone']
+    diabetes_id = name_to_id['Type 2 Diabetes Mellitus']
     
+    prednisone_bit = med_bit[prednisone_id]
+    diabetes_bit = cond_bit[diabetes_id]
+
     rca_patients = set()
     for pid, uuid in patient_id_map.items():
-        has_prednisone = False
-        has_diabetes = False
-        for target, rel in adj[uuid]:
-            if rel == 'PRESCRIBED_MEDICATION' and target == prednisone_id:
-                has_prednisone = True
-            if rel == 'HAS_CONDITION' and target == diabetes_id:
-                has_diabetes = True
-        
-        if has_prednisone and has_diabetes:
+        if patient_med_mask[uuid] & prednisone_bit and patient_cond_mask[uuid] & diabetes_bit:
             rca_patients.add(pid)
             
     gt['Root Cause Analysis'] = rca_patients
@@ -140,121 +225,155 @@ def get_ground_truth(nodes, edges, adj, patient_id_map, reverse_patient_id_map):
     # Scenario 4 (Report 1): Indirect Contraindication Risk (CHF)
     # Find (M)-[:CONTRAINDICATED_FOR]->(CHF)
     # CHF ID: 9a468e15-4c0f-4ce4-9f3e-b8ff5d6e928b (from json or lookup)
-    chf_id = next(n['id'] for n in nodes.values() if n['properties'].get('name') == 'Congestive Heart Failure')
+    chf_id = name_to_id['Congestive Heart Failure']
     
-    contra_meds_chf = set()
-    for e in edges:
-        if e['relationType'] == 'CONTRAINDICATED_FOR' and e['targetNodeId'] == chf_id:
-            contra_meds_chf.add(e['sourceNodeId'])
-            
+    chf_bit = cond_bit[chf_id]
+    contra_meds_chf_mask = 0
+    for mb, cb in contraindications:
+        if cb == chf_bit:
+            contra_meds_chf_mask |= mb
+
     indirect_contra_patients = set()
     for pid, uuid in patient_id_map.items():
         # Check if patient takes any of these meds
-        patient_meds = [target for target, rel in adj[uuid] if rel == 'PRESCRIBED_MEDICATION']
-        if any(m in contra_meds_chf for m in patient_meds):
+        if patient_med_mask[uuid] & contra_meds_chf_mask:
             indirect_contra_patients.add(pid)
             
     gt['Indirect Contraindication Risk'] = indirect_contra_patients
     
     # Scenario 4 (Report 2): Shared Doctor Risk (RA)
     # Find Doctors treating RA patients
-    ra_id = "e5581355-937b-40db-ab3f-034cd9e0ebfa" # From previous code
-    
+    # ra_iid resolved from the UUID constant in the Intersection scenario above
+
     ra_doctors = set()
-    # Find patients with RA
-    ra_patients = set()
-    for pid, uuid in patient_id_map.items():
-        conditions = [target for target, rel in adj[uuid] if rel == 'HAS_CONDITION']
-        if ra_id in conditions:
-            ra_patients.add(uuid)
-            
+    # Find patients with RA straight from the condition index
+    ra_patients = cond_to_patients.get(ra_iid, ())
+
     # Find doctors of these patients
     for p_uuid in ra_patients:
-        docs = [target for target, rel in adj[p_uuid] if rel == 'TREATED_BY']
-        ra_doctors.update(docs)
+        ra_doctors.update(patient_docs[p_uuid])
         
-    # Find ALL patients of these doctors
-    shared_doctor_patients = set()
-    for doc_id in ra_doctors:
-        for e in edges:
-            if e['relationType'] == 'TREATED_BY' and e['targetNodeId'] == doc_id:
-                pat_uuid = e['sourceNodeId']
-                if pat_uuid in reverse_patient_id_map:
-                    shared_doctor_patients.add(reverse_patient_id_map[pat_uuid])
-                    
+    # Find ALL patients of these doctors via the doctor index
+    shared_doctor_patients = {reverse_patient_id_map[pat_uuid]
+                              for doc_id in ra_doctors
+                              for pat_uuid in doc_to_patients.get(doc_id, ())
+                              if pat_uuid in reverse_patient_id_map}
+
     gt['Shared Doctor Risk'] = shared_doctor_patients
     
     return gt
 
+# Ground truth is pure over the input JSON, so cache it to disk across runs.
+# The key hashes both the JSON bytes and the source of get_ground_truth, so
+# editing either the data or the logic invalidates the cache automatically.
+_GT_CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+def get_ground_truth_cached(json_path):
+    digest = hashlib.blake2b(Path(json_path).read_bytes(), digest_size=16)
+    digest.update(inspect.getsource(get_ground_truth).encode())
+    cache_path = _GT_CACHE_DIR / f'gt_{digest.hexdigest()}.pkl'
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Stale/corrupt cache: fall through and recompute
+
+    gt = get_ground_truth(*load_graph(json_path))
+
+    try:
+        _GT_CACHE_DIR.mkdir(exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(gt, f, protocol=5)
+    except OSError:
+        pass  # Cache is best-effort; never fail the run over it
+
+    return gt
+
 # 3. Parse Reports
+# Compiled once at import and run over raw bytes, so the regex engine scans
+# the mmap'd report directly — no per-file str decode, no per-section compiles.
+# Headers delimit the sections; the block patterns are then searched only
+# within each section's slice, so a missing block yields an empty set for
+# that section instead of the match bleeding into the next one.
+HEADER_RE = re.compile(rb'## \d+\. (?P<title>.+?)\n')
+VEC_RE = re.compile(rb'\*\*Vector-Only \(Naive RAG\):\*\*\n```(.*?)```', re.DOTALL)
+KM_RE = re.compile(rb'\*\*Knowledge Model \(Graph RAG\):\*\*\n```(.*?)```', re.DOTALL)
+PT_RE = re.compile(rb'PT-\d{5}')
+
 def parse_reports(report_files):
     results = {}
-    
+
     # Regex to find patient IDs in the report tables/blocks
     # Pattern: | ... | ... | **Patient ID:** PT-XXXXX ...
     # Or just extracting PT-XXXXX from the raw text blocks
-    
+
+    def extract_ids(block):
+        # Decode only the matched IDs, never the whole block
+        return {pt.decode('ascii') for pt in PT_RE.findall(block)}
+
     for filepath, scenarios in report_files.items():
-        with open(filepath, 'r') as f:
-            content = f.read()
-            
-        # Split by scenario headers
-        # This is a bit brittle, assuming standard markdown structure
-        sections = re.split(r'## \d+\. ', content)
-        
-        for section in sections[1:]: # Skip preamble
-            lines = section.split('\n')
-            title = lines[0].strip()
-            
-            # Identify scenario key - using first few words of title
-            key = title
-            
-            # Extract Vector results
-            vector_match = re.search(r'\*\*Vector-Only \(Naive RAG\):\*\*\n```(.*?)```', section, re.DOTALL)
-            km_match = re.search(r'\*\*Knowledge Model \(Graph RAG\):\*\*\n```(.*?)```', section, re.DOTALL)
-            
-            def extract_ids(text_block):
-                if not text_block: return set()
-                return set(re.findall(r'PT-\d{5}', text_block))
-            
-            results[key] = {
-                'Vector': extract_ids(vector_match.group(1) if vector_match else ""),
-                'KM': extract_ids(km_match.group(1) if km_match else "")
-            }
-            
+        with open(filepath, 'rb') as f:
+            # mmap rejects zero-length files; an empty report has no sections
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            headers = list(HEADER_RE.finditer(mm))
+            for i, m in enumerate(headers):
+                # Identify scenario key - using first few words of title
+                key = m.group('title').strip().decode('utf-8')
+                # Search only within this section: from after its header to
+                # the next header (pos/endpos keeps the scan copy-free)
+                end = headers[i + 1].start() if i + 1 < len(headers) else len(mm)
+                vec = VEC_RE.search(mm, m.end(), end)
+                km = KM_RE.search(mm, m.end(), end)
+                results[key] = {
+                    'Vector': extract_ids(vec.group(1)) if vec else set(),
+                    'KM': extract_ids(km.group(1)) if km else set()
+                }
+            mm.close()
+
     return results
 
 # 4. Calculate Metrics
+def _pt_id_array(id_set):
+    # 'PT-12345' -> 12345, sorted uint32: set hashing of 8-char strings becomes
+    # a C-level sorted-merge intersection downstream
+    return np.fromiter(sorted(int(s[3:]) for s in id_set), dtype=np.uint32, count=len(id_set))
+
 def calculate_metrics(gt, results):
-    metrics = []
-    
-    for scenario, data in results.items():
-        if scenario not in gt: continue
-        
-        true_set = gt[scenario]
-        
-        for method in ['Vector', 'KM']:
-            retrieved = data[method]
-            
-            # Precision: |Retrieved ∩ True| / |Retrieved|
-            # Recall: |Retrieved ∩ True| / |True|
-            
-            intersection = len(retrieved.intersection(true_set))
-            precision = intersection / len(retrieved) if retrieved else 0
-            recall = intersection / len(true_set) if true_set else 0
-            f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-            
-            metrics.append({
-                'Scenario': scenario,
-                'Method': method,
-                'Precision': precision,
-                'Recall': recall,
-                'F1 Score': f1,
-                'Retrieved Count': len(retrieved),
-                'True Count': len(true_set)
-            })
-            
-    return pd.DataFrame(metrics)
+    # One (scenario, method) row per retrieved set, metrics computed as
+    # whole-array numpy ops instead of per-row scalar divisions.
+    # Truth sets are converted once per scenario, not once per method.
+    true_arrs = {scenario: _pt_id_array(gt[scenario]) for scenario in results if scenario in gt}
+
+    rows = [(scenario, method, _pt_id_array(data[method]), true_arrs[scenario])
+            for scenario, data in results.items() if scenario in gt
+            for method in ['Vector', 'KM']]
+
+    n = len(rows)
+    tp = np.fromiter((np.intersect1d(r, t, assume_unique=True).size for _, _, r, t in rows),
+                     dtype=np.int32, count=n)
+    retrieved_n = np.fromiter((r.size for _, _, r, _ in rows), dtype=np.int32, count=n)
+    true_n = np.fromiter((t.size for _, _, _, t in rows), dtype=np.int32, count=n)
+
+    # Precision: |Retrieved ∩ True| / |Retrieved|
+    # Recall: |Retrieved ∩ True| / |True|
+    precision = np.divide(tp, retrieved_n, out=np.zeros(n), where=retrieved_n > 0)
+    recall = np.divide(tp, true_n, out=np.zeros(n), where=true_n > 0)
+    pr_sum = precision + recall
+    f1 = np.divide(2 * precision * recall, pr_sum, out=np.zeros(n), where=pr_sum > 0)
+
+    return pd.DataFrame({
+        'Scenario': [s for s, _, _, _ in rows],
+        'Method': [m for _, m, _, _ in rows],
+        'Precision': precision,
+        'Recall': recall,
+        'F1 Score': f1,
+        'Retrieved Count': retrieved_n,
+        'True Count': true_n
+    })
 
 # Main Execution
 if __name__ == "__main__":
@@ -277,11 +396,8 @@ if __name__ == "__main__":
         ]
     }
     
-    print("Loading Knowledge Graph...")
-    nodes, edges, adj, pid_map, r_pid_map = load_graph(json_path)
-    
     print("Generating Ground Truth...")
-    gt = get_ground_truth(nodes, edges, adj, pid_map, r_pid_map)
+    gt = get_ground_truth_cached(json_path)
     
     print("Parsing Benchmark Reports...")
     results = parse_reports(report_files)
@@ -293,15 +409,16 @@ if __name__ == "__main__":
     print(df.to_string(index=False))
     
     # Visualization
-    scenarios = df['Scenario'].unique()
     metrics_to_plot = ['Precision', 'Recall', 'F1 Score']
-    
+
     fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-    
+
+    # Pivot once for all metrics; each subplot slices the shared frame
+    pivot = df.pivot(index='Scenario', columns='Method', values=metrics_to_plot)
+
     for i, metric in enumerate(metrics_to_plot):
         ax = axes[i]
-        pivot = df.pivot(index='Scenario', columns='Method', values=metric)
-        pivot.plot(kind='bar', ax=ax, color=['#ff9999', '#66b3ff'])
+        pivot[metric].plot(kind='bar', ax=ax, color=['#ff9999', '#66b3ff'])
         ax.set_title(f'{metric} Comparison')
         ax.set_ylim(0, 1.1)
         ax.grid(axis='y', linestyle='--', alpha=0.7)
@@ -1,5 +1,14 @@
+import itertools
 import json
 import random
+import numpy as np
+from multiprocessing import Pool
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 import uuid
 from datetime import datetime, timedelta
 
@@ -34,45 +43,192 @@ MEDICATIONS = [
     {"name": "Atorvastatin", "class": "Statin", "treats": "Hyperlipidemia", "dosage": ["10mg", "20mg", "40mg"], "side_effects": ["muscle pain", "liver enzyme elevation"]}
 ]
 
-def random_date(start_year=2015, end_year=2024):
+# Loop invariants hoisted out of the per-patient loop: the safe-medication
+# list per condition and the name lookup never change between patients
+MED_BY_NAME = {m["name"]: m for m in MEDICATIONS}
+SAFE_MEDS_BY_COND = {
+    c["name"]: [m for m in MEDICATIONS if m["name"] not in c["contraindications"]]
+    for c in CONDITIONS
+}
+
+# Per-condition note fragments: the risk-factor string is deterministic and
+# the reported symptoms are one of a small pool of pre-joined pairs
+COND_RISK_STR = {c["name"]: ", ".join(c["risk_factors"]) for c in CONDITIONS}
+SYMPTOM_PAIRS = {
+    c["name"]: [", ".join(pair) for pair in itertools.combinations(c["symptoms"], 2)]
+    for c in CONDITIONS
+}
+
+def random_date(start_year=2015, end_year=2024, rnd=random):
     start = datetime(start_year, 1, 1)
     end = datetime(end_year, 12, 31)
-    return start + timedelta(days=random.randint(0, (end - start).days))
+    return start + timedelta(days=rnd.randint(0, (end - start).days))
 
-def generate_clinical_note(patient_code, condition, medication, doctor_code, behavioral, vitals, adherence):
-    symptoms = ", ".join(random.sample(condition["symptoms"], k=min(2, len(condition["symptoms"]))))
-    
-    note = f"""
-**CLINICAL ENCOUNTER NOTE**
+# Invariants hoisted out of the per-patient loop: the encounter date is the
+# same for every note in a run, and the template is parsed exactly once
+TODAY_STR = datetime.now().strftime('%Y-%m-%d')
+
+NOTE_TEMPLATE = """**CLINICAL ENCOUNTER NOTE**
 **Patient ID:** {patient_code}
 **Provider ID:** {doctor_code}
-**Date:** {datetime.now().strftime('%Y-%m-%d')}
+**Date:** {today}
 
 **SUBJECTIVE:**
-Patient presents for follow-up of {condition['name']}. Reports {symptoms}. 
+Patient presents for follow-up of {condition_name}. Reports {symptoms}. 
 Behavioral Assessment:
-- Smoking: {behavioral['smoking']}
-- Alcohol: {behavioral['alcohol']}
-- Activity: {behavioral['activity']}
-- Stress: {behavioral['stress']}
-- Diet Adherence: {behavioral['diet']}
+- Smoking: {smoking}
+- Alcohol: {alcohol}
+- Activity: {activity}
+- Stress: {stress}
+- Diet Adherence: {diet}
 
 Patient reports medication adherence is {adherence}.
 
 **OBJECTIVE:**
-Vitals: BP {vitals['bp']}, HR {vitals['hr']}, BMI {vitals['bmi']}, HbA1c {vitals['hba1c']}%.
-Lab Trends: {random.choice(['Stable', 'Worsening', 'Improving'])} since last visit ({random_date(2023, 2023).strftime('%Y-%m-%d')}).
+Vitals: BP {bp}, HR {hr}, BMI {bmi}, HbA1c {hba1c}%.
+Lab Trends: {lab_trend} since last visit ({last_visit}).
 
 **ASSESSMENT:**
-1. {condition['name']} ({condition['icd10']}) - {random.choice(['Stable', 'Uncontrolled', 'Improving'])}.
-2. Risk factors discussed: {", ".join(condition['risk_factors'])}.
+1. {condition_name} ({icd10}) - {assessment}.
+2. Risk factors discussed: {risk_factors}.
 
 **PLAN:**
-1. Continue {medication['name']} {random.choice(medication['dosage'])} PO daily.
-2. Lifestyle modification counseling provided regarding {behavioral['smoking']} and {behavioral['diet']} diet.
-3. Follow up in 3 months.
-"""
-    return note.strip()
+1. Continue {med_name} {dosage} PO daily.
+2. Lifestyle modification counseling provided regarding {smoking} and {diet} diet.
+3. Follow up in 3 months."""
+
+def generate_clinical_note(patient_code, condition, medication, doctor_code, behavioral, vitals, adherence, rnd=random):
+    symptoms = rnd.choice(SYMPTOM_PAIRS[condition["name"]])
+
+    return NOTE_TEMPLATE.format(
+        patient_code=patient_code,
+        doctor_code=doctor_code,
+        today=TODAY_STR,
+        condition_name=condition['name'],
+        symptoms=symptoms,
+        smoking=behavioral['smoking'],
+        alcohol=behavioral['alcohol'],
+        activity=behavioral['activity'],
+        stress=behavioral['stress'],
+        diet=behavioral['diet'],
+        adherence=adherence,
+        bp=vitals['bp'],
+        hr=vitals['hr'],
+        bmi=vitals['bmi'],
+        hba1c=vitals['hba1c'],
+        lab_trend=rnd.choice(['Stable', 'Worsening', 'Improving']),
+        last_visit=random_date(2023, 2023, rnd).strftime('%Y-%m-%d'),
+        icd10=condition['icd10'],
+        assessment=rnd.choice(['Stable', 'Uncontrolled', 'Improving']),
+        risk_factors=COND_RISK_STR[condition['name']],
+        med_name=medication['name'],
+        dosage=rnd.choice(medication['dosage']),
+    )
+
+# Per-patient generation is independent of every other patient, so it can be
+# farmed out to worker processes. Each worker gets its own seeded RNG to keep
+# runs deterministic for a given base seed regardless of scheduling order.
+def _make_patient(i, seed, condition_map, med_map, doctors,
+                  behavioral, age_group, gender, cond_i, doc_i, bad_draw):
+    rnd = random.Random(seed)
+    patient_id = str(uuid.uuid4())
+    patient_code = f"PT-{10000+i}"
+    edges = []
+    chunks = []
+
+    node = {
+        "id": patient_id,
+        "label": "Patient",
+        "properties": {
+            "patient_id": patient_code,
+            "age_group": age_group,
+            "gender": gender,
+            "smoking_status": behavioral["smoking"],
+            "alcohol_consumption": behavioral["alcohol"],
+            "activity_level": behavioral["activity"],
+            "stress_level": behavioral["stress"]
+        }
+    }
+
+    # Assign Condition
+    cond = CONDITIONS[cond_i]
+    cond_id = condition_map[cond["name"]]
+    diagnosis_date = random_date(2015, 2023, rnd)
+    edges.append({
+        "id": str(uuid.uuid4()),
+        "sourceNodeId": patient_id,
+        "targetNodeId": cond_id,
+        "relationType": "HAS_CONDITION",
+        "properties": {
+            "diagnosed_date": diagnosis_date.strftime("%Y-%m-%d"),
+            "status": "Active",
+            "severity": rnd.choice(["Mild", "Moderate", "Severe"])
+        }
+    })
+
+    # Assign Medication (Logic for Contraindications)
+    med_data = None
+    # 15% chance of dangerous prescription (Contraindicated)
+    if bad_draw:
+        bad_med_name = rnd.choice(cond["contraindications"])
+        if bad_med_name in med_map:
+            med_data = MED_BY_NAME[bad_med_name]
+
+    if not med_data:
+        safe_meds = SAFE_MEDS_BY_COND[cond["name"]]
+        if safe_meds:
+            med_data = rnd.choice(safe_meds)
+
+    if med_data:
+        med_id = med_map[med_data["name"]]
+        adherence = rnd.choice(["Good", "Poor", "Variable"])
+        edges.append({
+            "id": str(uuid.uuid4()),
+            "sourceNodeId": patient_id,
+            "targetNodeId": med_id,
+            "relationType": "PRESCRIBED_MEDICATION",
+            "properties": {
+                "start_date": (diagnosis_date + timedelta(days=rnd.randint(0, 30))).strftime("%Y-%m-%d"),
+                "adherence": adherence,
+                "dosage": rnd.choice(med_data["dosage"])
+            }
+        })
+
+        # Assign Doctor
+        doc = doctors[doc_i]
+        edges.append({
+            "id": str(uuid.uuid4()),
+            "sourceNodeId": patient_id,
+            "targetNodeId": doc["id"],
+            "relationType": "TREATED_BY",
+            "properties": {
+                "last_visit": TODAY_STR,
+                "visit_frequency": rnd.choice(["Monthly", "Quarterly", "Annually"])
+            }
+        })
+
+        # Generate Clinical Note (Chunk)
+        vitals = {
+            "bp": f"{rnd.randint(110, 160)}/{rnd.randint(70, 100)}",
+            "hr": rnd.randint(60, 100),
+            "bmi": round(rnd.uniform(18.5, 35.0), 1),
+            "hba1c": round(rnd.uniform(5.0, 12.0), 1)
+        }
+
+        note_text = generate_clinical_note(patient_code, cond, med_data, doc["code"], behavioral, vitals, adherence, rnd)
+
+        chunks.append({
+            "id": str(uuid.uuid4()),
+            "content": note_text,
+            "linkedNodeId": patient_id,
+            "metadata": {
+                "type": "clinical_note",
+                "date": TODAY_STR,
+                "patient_id": patient_code
+            }
+        })
+
+    return node, edges, chunks
 
 def generate_data():
     nodes = []
@@ -89,7 +245,7 @@ def generate_data():
             "properties": {
                 "name": cond["name"],
                 "icd10": cond["icd10"],
-                "risk_factors": ", ".join(cond["risk_factors"])
+                "risk_factors": COND_RISK_STR[cond["name"]]
             }
         })
         condition_map[cond["name"]] = node_id
@@ -202,109 +358,34 @@ Board Certified: Yes
         })
 
     # 4. Create Patients and Clinical Data (Anonymized & Behavioral)
-    for i in range(NUM_PATIENTS):
-        patient_id = str(uuid.uuid4())
-        patient_code = f"PT-{10000+i}"
-        
-        behavioral = {
-            "smoking": random.choice(SMOKING_STATUS),
-            "alcohol": random.choice(ALCOHOL_CONSUMPTION),
-            "activity": random.choice(ACTIVITY_LEVEL),
-            "diet": random.choice(DIET_ADHERENCE),
-            "stress": random.choice(STRESS_LEVELS)
-        }
+    # All categorical draws are batched through numpy's C-level RNG up front;
+    # the worker loop only indexes into the precomputed columns
+    rng = np.random.default_rng(random.randrange(1 << 30))
+    smokings = rng.choice(SMOKING_STATUS, NUM_PATIENTS).tolist()
+    alcohols = rng.choice(ALCOHOL_CONSUMPTION, NUM_PATIENTS).tolist()
+    activities = rng.choice(ACTIVITY_LEVEL, NUM_PATIENTS).tolist()
+    diets = rng.choice(DIET_ADHERENCE, NUM_PATIENTS).tolist()
+    stresses = rng.choice(STRESS_LEVELS, NUM_PATIENTS).tolist()
+    ages = rng.choice(AGE_GROUPS, NUM_PATIENTS).tolist()
+    genders = rng.choice(GENDERS, NUM_PATIENTS).tolist()
+    cond_idx = rng.integers(len(CONDITIONS), size=NUM_PATIENTS).tolist()
+    doc_idx = rng.integers(len(doctors), size=NUM_PATIENTS).tolist()
+    bad_draws = (rng.random(NUM_PATIENTS) < 0.15).tolist()
 
-        nodes.append({
-            "id": patient_id,
-            "label": "Patient",
-            "properties": {
-                "patient_id": patient_code,
-                "age_group": random.choice(AGE_GROUPS),
-                "gender": random.choice(GENDERS),
-                "smoking_status": behavioral["smoking"],
-                "alcohol_consumption": behavioral["alcohol"],
-                "activity_level": behavioral["activity"],
-                "stress_level": behavioral["stress"]
-            }
-        })
-
-        # Assign Condition
-        cond = random.choice(CONDITIONS)
-        cond_id = condition_map[cond["name"]]
-        diagnosis_date = random_date(2015, 2023)
-        edges.append({
-            "id": str(uuid.uuid4()),
-            "sourceNodeId": patient_id,
-            "targetNodeId": cond_id,
-            "relationType": "HAS_CONDITION",
-            "properties": {
-                "diagnosed_date": diagnosis_date.strftime("%Y-%m-%d"),
-                "status": "Active",
-                "severity": random.choice(["Mild", "Moderate", "Severe"])
-            }
-        })
+    # Independent per patient, so generated in parallel worker processes
+    base_seed = random.randrange(1 << 30)
+    args = [(i, base_seed + i, condition_map, med_map, doctors,
+             {"smoking": smokings[i], "alcohol": alcohols[i], "activity": activities[i],
+              "diet": diets[i], "stress": stresses[i]},
+             ages[i], genders[i], cond_idx[i], doc_idx[i], bad_draws[i])
+            for i in range(NUM_PATIENTS)]
+    with Pool() as pool:
+        results = pool.starmap(_make_patient, args, chunksize=64)
 
-        # Assign Medication (Logic for Contraindications)
-        med_data = None
-        # 15% chance of dangerous prescription (Contraindicated)
-        if random.random() < 0.15:
-            bad_med_name = random.choice(cond["contraindications"])
-            if bad_med_name in med_map:
-                med_data = next(m for m in MEDICATIONS if m["name"] == bad_med_name)
-        
-        if not med_data:
-            safe_meds = [m for m in MEDICATIONS if m["name"] not in cond["contraindications"]]
-            if safe_meds:
-                med_data = random.choice(safe_meds)
-
-        if med_data:
-            med_id = med_map[med_data["name"]]
-            adherence = random.choice(["Good", "Poor", "Variable"])
-            edges.append({
-                "id": str(uuid.uuid4()),
-                "sourceNodeId": patient_id,
-                "targetNodeId": med_id,
-                "relationType": "PRESCRIBED_MEDICATION",
-                "properties": {
-                    "start_date": (diagnosis_date + timedelta(days=random.randint(0, 30))).strftime("%Y-%m-%d"),
-                    "adherence": adherence,
-                    "dosage": random.choice(med_data["dosage"])
-                }
-            })
-
-            # Assign Doctor
-            doc = random.choice(doctors)
-            edges.append({
-                "id": str(uuid.uuid4()),
-                "sourceNodeId": patient_id,
-                "targetNodeId": doc["id"],
-                "relationType": "TREATED_BY",
-                "properties": {
-                    "last_visit": datetime.now().strftime("%Y-%m-%d"),
-                    "visit_frequency": random.choice(["Monthly", "Quarterly", "Annually"])
-                }
-            })
-
-            # Generate Clinical Note (Chunk)
-            vitals = {
-                "bp": f"{random.randint(110, 160)}/{random.randint(70, 100)}",
-                "hr": random.randint(60, 100),
-                "bmi": round(random.uniform(18.5, 35.0), 1),
-                "hba1c": round(random.uniform(5.0, 12.0), 1)
-            }
-            
-            note_text = generate_clinical_note(patient_code, cond, med_data, doc["code"], behavioral, vitals, adherence)
-            
-            chunks.append({
-                "id": str(uuid.uuid4()),
-                "content": note_text,
-                "linkedNodeId": patient_id,
-                "metadata": {
-                    "type": "clinical_note",
-                    "date": datetime.now().strftime("%Y-%m-%d"),
-                    "patient_id": patient_code
-                }
-            })
+    for node, patient_edges, patient_chunks in results:
+        nodes.append(node)
+        edges.extend(patient_edges)
+        chunks.extend(patient_chunks)
 
     output = {
         "nodes": nodes,
@@ -313,8 +394,12 @@ Board Certified: Yes
     }
 
     output_path = "../medical_benchmark_data.json"
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=2)
+    if HAS_ORJSON:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(output, f, indent=2)
     
     print(f"Generated {len(nodes)} nodes, {len(edges)} edges, {len(chunks)} chunks to {output_path}")
 
@@ -1,29 +1,73 @@
 import csv
-import random
+import io
 import os
 from datetime import datetime, timedelta
 import uuid
 
+import numpy as np
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
 # Configuration
 OUTPUT_DIR = "../sap_data"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # --- Helpers ---
+FLOAT_FORMAT = "%.2f"  # monetary amounts stay raw floats until write time
+
+def _format_row(row):
+    return [(FLOAT_FORMAT % v) if isinstance(v, float) else str(v) for v in row]
+
+def _csv_safe(rows):
+    # Fast-path guard: fields here are numerics/IDs, but anything containing
+    # a delimiter, quote or newline must go through a real CSV writer
+    return not any(',' in v or '"' in v or '\n' in v for row in rows for v in row)
+
+def _render_csv(header_line, rows):
+    lines = [header_line] if header_line is not None else []
+    lines.extend(','.join(row) for row in rows)
+    lines.append('')
+    return '\n'.join(lines)
+
+# CSV text collected per output path and flushed once at the end of the run,
+# so each file costs a single open/write instead of one per write/append call
+_buffers = {}
+
+def _render_rows(formatted, headers=None):
+    if _csv_safe(formatted):
+        # One preformatted buffer instead of per-row writer calls
+        return _render_csv(','.join(headers) if headers else None, formatted)
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    if headers:
+        writer.writerow(headers)
+    writer.writerows(formatted)
+    return buf.getvalue()
+
 def write_csv(filename, headers, rows):
     path = os.path.join(OUTPUT_DIR, filename)
-    with open(path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(rows)
+    if HAS_PANDAS and isinstance(rows, pd.DataFrame):
+        _buffers[path] = [rows.to_csv(index=False, float_format=FLOAT_FORMAT)]
+        print(f"Generated {path} with {len(rows)} rows.")
+        return
+
+    _buffers[path] = [_render_rows([_format_row(r) for r in rows], headers)]
     print(f"Generated {path} with {len(rows)} rows.")
 
 def append_csv(filename, rows):
     path = os.path.join(OUTPUT_DIR, filename)
-    with open(path, 'a', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
+    _buffers.setdefault(path, []).append(_render_rows([_format_row(r) for r in rows]))
     print(f"Appended {len(rows)} rows to {path}.")
 
+def flush_csv_buffers():
+    for path, parts in _buffers.items():
+        with open(path, 'w', newline='', buffering=1 << 20) as f:
+            f.write(''.join(parts))
+
 # ==========================================
 # SCENARIO 1: FINANCIAL GL (Shadow IT)
 # ==========================================
@@ -86,49 +130,59 @@ write_csv("PROJECTS.csv", ["PROJECT_ID", "NAME", "DEPT_ID", "STATUS"], projects)
 bkpf_rows = [] # BELNR, GJAHR, BLDAT, BKTXT
 bseg_rows = [] # BELNR, GJAHR, BUZEI, KOSTL, LIFNR, DMBTR, HKONT (GL Acc)
 
+DAYS = 90
 start_date = datetime(2025, 1, 1)
+# Invariants hoisted out of the transaction loop: every date string is
+# formatted exactly once, the fiscal year never changes
+date_strs = [(start_date + timedelta(days=d)).strftime("%Y%m%d") for d in range(DAYS)]
+year_str = str(start_date.year)
 doc_id_counter = 100000
 
-def add_transaction(date, vendor_id, amount, cost_center, gl_account="600000"):
+# Fixed seed: bulk draws stay vectorized and every run produces the same
+# transaction data, so benchmark datasets are reproducible
+rng = np.random.default_rng(0)
+
+def add_transaction(day_idx, vendor_id, amount, cost_center, gl_account="600000"):
     global doc_id_counter
     doc_id = str(doc_id_counter)
-    year = str(date.year)
     
     # Header
-    bkpf_rows.append([doc_id, year, date.strftime("%Y%m%d"), "Vendor Invoice"])
+    bkpf_rows.append((doc_id, year_str, date_strs[day_idx], "Vendor Invoice"))
     
     # Segment (Expense Line)
-    bseg_rows.append([doc_id, year, "1", cost_center, vendor_id, f"{amount:.2f}", gl_account])
+    bseg_rows.append((doc_id, year_str, "1", cost_center, vendor_id, float(amount), gl_account))
     
     doc_id_counter += 1
 
 # Generate legitimate traffic
-for day in range(90):
-    current_date = start_date + timedelta(days=day)
-    
-    # AWS Bill (Monthly)
-    if day % 30 == 0:
-        add_transaction(current_date, "V-1000", random.uniform(5000, 5500), "CC-101")
-    
-    # Random Office Supplies
-    if random.random() < 0.1:
-        add_transaction(current_date, "V-1003", random.uniform(50, 200), random.choice(cost_centers)[0])
+# AWS Bill (Monthly)
+for day in range(0, DAYS, 30):
+    add_transaction(day, "V-1000", rng.uniform(5000, 5500), "CC-101")
+
+# Random Office Supplies: pick the active days and draw all randoms in bulk
+cc_ids = [c[0] for c in cost_centers]
+office_days = np.nonzero(rng.random(DAYS) < 0.1)[0]
+office_amts = rng.uniform(50, 200, office_days.size)
+office_ccs = rng.choice(cc_ids, office_days.size)
+for day, amount, cc in zip(office_days.tolist(), office_amts.tolist(), office_ccs.tolist()):
+    add_transaction(day, "V-1003", amount, cc)
 
 # Generate Shadow IT Pattern (Increasing trend, fragmented)
 # Month 1: Small tests
-add_transaction(start_date + timedelta(days=10), "V-9999", 49.00, "CC-102") # Data Science
-add_transaction(start_date + timedelta(days=15), "V-9999", 49.00, "CC-100") # Eng Core
+add_transaction(10, "V-9999", 49.00, "CC-102") # Data Science
+add_transaction(15, "V-9999", 49.00, "CC-100") # Eng Core
 
 # Month 2: More adoption
-add_transaction(start_date + timedelta(days=40), "V-9999", 99.00, "CC-102")
-add_transaction(start_date + timedelta(days=42), "V-9999", 99.00, "CC-200") # Marketing joins in
-add_transaction(start_date + timedelta(days=45), "V-9999", 150.00, "CC-101")
+add_transaction(40, "V-9999", 99.00, "CC-102")
+add_transaction(42, "V-9999", 99.00, "CC-200") # Marketing joins in
+add_transaction(45, "V-9999", 150.00, "CC-101")
 
 # Month 3: Explosion (but individual txns still small-ish)
-for _ in range(5):
-    day_offset = random.randint(60, 85)
-    cc = random.choice(cost_centers)[0]
-    add_transaction(start_date + timedelta(days=day_offset), "V-9999", random.uniform(200, 400), cc)
+shadow_days = rng.integers(60, 86, 5)
+shadow_amts = rng.uniform(200, 400, 5)
+shadow_ccs = rng.choice(cc_ids, 5)
+for day, amount, cc in zip(shadow_days.tolist(), shadow_amts.tolist(), shadow_ccs.tolist()):
+    add_transaction(day, "V-9999", amount, cc)
 
 write_csv("BKPF.csv", ["BELNR", "GJAHR", "BLDAT", "BKTXT"], bkpf_rows)
 write_csv("BSEG.csv", ["BELNR", "GJAHR", "BUZEI", "KOSTL", "LIFNR", "DMBTR", "HKONT"], bseg_rows)
@@ -225,4 +279,5 @@ vendor_supplies = [
 ]
 write_csv("VENDOR_SUPPLIES.csv", ["VENDOR_ID", "COMPONENT_ID"], vendor_supplies)
 
+flush_csv_buffers()
 print("SAP Data Generation Complete.")
@@ -15,30 +15,47 @@ Since: v0.6
 """
 
 import argparse
+import functools
+import importlib.util
 import json
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as mpatches
-    import numpy as np
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+# Availability checks without paying the import cost: the heavy libraries
+# are only loaded via _lazy_imports() once arguments are validated, so
+# --help and error paths stay fast.
+HAS_MATPLOTLIB = importlib.util.find_spec('matplotlib') is not None
+if not HAS_MATPLOTLIB:
     print("Warning: matplotlib not installed. Install with: pip install matplotlib")
 
-try:
-    import pandas as pd
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
+HAS_PANDAS = importlib.util.find_spec('pandas') is not None
+if not HAS_PANDAS:
     print("Warning: pandas not installed. Install with: pip install pandas")
 
+HAS_ORJSON = importlib.util.find_spec('orjson') is not None  # optional C parser
+
+
+def _lazy_imports():
+    """Import the plotting stack; called after argument validation."""
+    global matplotlib, plt, mpatches, np, pd, orjson
+    if HAS_MATPLOTLIB:
+        import matplotlib
+        matplotlib.use('Agg')  # headless: charts are only written to files
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as mpatches
+        import numpy as np
+        plt.rcParams['font.family'] = 'DejaVu Sans'
+    if HAS_PANDAS:
+        import pandas as pd
+    if HAS_ORJSON:
+        import orjson
+
 
 # Configuration
 DEFAULT_RESULTS_DIR = "benchmark-results"
@@ -61,234 +78,321 @@ BACKEND_LABELS = {
     'pgage': 'PostgreSQL AGE'
 }
 
+# Labels and colors hoisted into tuples aligned with the BACKENDS order so
+# chart code indexes them instead of rebuilding the same lists per chart
+BACKEND_LABEL_TUPLE = tuple(BACKEND_LABELS[b] for b in BACKENDS)
+BACKEND_COLOR_TUPLE = tuple(BACKEND_COLORS[b] for b in BACKENDS)
+
 
 @dataclass
 class BenchmarkData:
-    """Parsed benchmark data for visualization."""
+    """Parsed benchmark data for visualization.
+
+    Latency percentiles are held as a single (n_scenarios, 3) float32 matrix
+    (columns: p50, p95, p99) so chart code can aggregate with column
+    reductions instead of per-scenario Python loops.
+    """
     backend: str
     dataset: str
     scenarios: List[str]
-    p50_latencies: List[float]
-    p95_latencies: List[float]
-    p99_latencies: List[float]
-    chunk_improvements: List[float]
-    latency_overheads: List[float]
+    latencies: 'np.ndarray'
+    chunk_improvements: 'np.ndarray'
+    latency_overheads: 'np.ndarray'
+
+    @functools.cached_property
+    def latency_means(self) -> 'np.ndarray':
+        """Column means of the percentile matrix (p50, p95, p99)."""
+        if self.latencies.size:
+            return self.latencies.mean(axis=0)
+        return np.zeros(3, dtype=np.float32)
+
+    @functools.cached_property
+    def overhead_mean(self) -> float:
+        """Mean latency overhead across scenarios."""
+        return float(self.latency_overheads.mean()) if self.latency_overheads.size else 0.0
+
+
+# Reusable figures keyed by axes-grid shape. Figure construction and
+# font-cache warmup dominate on small datasets, so each chart clears the
+# cached axes instead of creating and closing a fresh figure.
+_FIGURES: Dict[Tuple[int, int], Tuple] = {}
+
+
+def _reusable_axes(nrows: int, ncols: int, figsize: Tuple[float, float]):
+    """Return a cached (fig, axes) for the given grid shape with axes cleared."""
+    key = (nrows, ncols)
+    cached = _FIGURES.get(key)
+    if cached is None:
+        fig = plt.figure(figsize=figsize, layout='constrained')
+        axes = fig.subplots(nrows, ncols)
+        _FIGURES[key] = (fig, axes)
+    else:
+        fig, axes = cached
+        fig.set_size_inches(*figsize)
+        for axis in np.atleast_1d(axes).ravel():
+            axis.cla()
+    return fig, axes
+
+
+@functools.lru_cache(maxsize=8)
+def _arange(n: int) -> 'np.ndarray':
+    """Cached np.arange for the small axis index arrays reused across charts."""
+    return np.arange(n)
+
+
+# Chart output format. SVG skips Agg rasterization entirely; --raster
+# switches back to 150 dpi PNG for consumers that need bitmaps.
+CHART_FORMAT = 'svg'
+
+# Freshness check inputs: newest input JSON mtime and the --force override.
+# Set per render task so worker processes see the same settings.
+INPUT_MTIME: Optional[float] = None
+FORCE = False
+
+
+def _is_fresh(output_dir: Path, stem: str) -> bool:
+    """True when the chart file is newer than every input JSON."""
+    if FORCE or INPUT_MTIME is None:
+        return False
+    output_path = output_dir / f'{stem}.{CHART_FORMAT}'
+    return output_path.exists() and output_path.stat().st_mtime >= INPUT_MTIME
+
+
+def _save_chart(fig, output_dir: Path, stem: str):
+    """Save a figure in the configured output format."""
+    output_path = output_dir / f'{stem}.{CHART_FORMAT}'
+    if CHART_FORMAT == 'png':
+        fig.savefig(output_path, dpi=150)
+    else:
+        fig.savefig(output_path)
+    print(f"Saved: {output_path}")
 
 
-def load_benchmark_data(results_dir: Path) -> List[BenchmarkData]:
-    """Load all benchmark data from results directory."""
+def load_benchmark_data(results_dir: Path) -> Tuple[List[BenchmarkData], Optional[float]]:
+    """Load all benchmark data plus the newest input mtime from results directory."""
     data_list = []
-    
+    input_mtime = None
+
     for backend in BACKENDS:
         backend_dir = results_dir / backend
         if not backend_dir.exists():
             continue
         
+        # One scandir per backend: DirEntry.stat() already carries st_mtime,
+        # so the newest file per dataset is found without per-glob stat calls.
+        newest: Dict[str, Tuple[float, str]] = {}
+        with os.scandir(backend_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.json'):
+                    continue
+                parts = name.split('_')
+                if len(parts) < 3 or parts[0] != backend or parts[1] not in DATASETS:
+                    continue
+                mtime = entry.stat().st_mtime
+                if parts[1] not in newest or mtime > newest[parts[1]][0]:
+                    newest[parts[1]] = (mtime, entry.path)
+
         for dataset in DATASETS:
-            pattern = f"{backend}_{dataset}_*.json"
-            files = list(backend_dir.glob(pattern))
-            if not files:
+            if dataset not in newest:
                 continue
-            
-            # Get most recent file
-            most_recent = max(files, key=lambda p: p.stat().st_mtime)
-            
+
+            mtime, path = newest[dataset]
+            if input_mtime is None or mtime > input_mtime:
+                input_mtime = mtime
+            most_recent = Path(path)
+
             try:
-                with open(most_recent, 'r') as f:
-                    result = json.load(f)
-                
+                raw = most_recent.read_bytes()
+                result = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+                # Single pass over the scenarios filling preallocated arrays
                 scenarios = result.get('scenarios', [])
+                names = []
+                latencies = np.zeros((len(scenarios), 3), dtype=np.float32)
+                chunk_improvements = np.zeros(len(scenarios), dtype=np.float32)
+                latency_overheads = np.zeros(len(scenarios), dtype=np.float32)
+                for i, s in enumerate(scenarios):
+                    names.append(s['name'])
+                    lat = s.get('latency', {})
+                    latencies[i, 0] = lat.get('p50Ms', 0)
+                    latencies[i, 1] = lat.get('p95Ms', 0)
+                    latencies[i, 2] = lat.get('p99Ms', 0)
+                    chunk_improvements[i] = s.get('chunkImprovementPct', 0)
+                    latency_overheads[i] = s.get('latencyOverheadPct', 0)
+
                 data_list.append(BenchmarkData(
                     backend=backend,
                     dataset=dataset,
-                    scenarios=[s['name'] for s in scenarios],
-                    p50_latencies=[s.get('latency', {}).get('p50Ms', 0) for s in scenarios],
-                    p95_latencies=[s.get('latency', {}).get('p95Ms', 0) for s in scenarios],
-                    p99_latencies=[s.get('latency', {}).get('p99Ms', 0) for s in scenarios],
-                    chunk_improvements=[s.get('chunkImprovementPct', 0) for s in scenarios],
-                    latency_overheads=[s.get('latencyOverheadPct', 0) for s in scenarios]
+                    scenarios=names,
+                    latencies=latencies,
+                    chunk_improvements=chunk_improvements,
+                    latency_overheads=latency_overheads
                 ))
             except Exception as e:
                 print(f"Warning: Failed to load {most_recent}: {e}")
-    
-    return data_list
+
+    return data_list, input_mtime
 
 
-def create_latency_comparison_chart(data_list: List[BenchmarkData], dataset: str, output_dir: Path):
+def create_latency_comparison_chart(dataset_data: List[BenchmarkData], dataset: str, output_dir: Path):
     """Create grouped bar chart comparing latencies across backends."""
-    if not HAS_MATPLOTLIB:
+    if not HAS_MATPLOTLIB or not HAS_PANDAS:
         return
-    
-    dataset_data = [d for d in data_list if d.dataset == dataset]
+
     if not dataset_data:
         print(f"No data for dataset: {dataset}")
         return
-    
+
+    if _is_fresh(output_dir, f'latency_comparison_{dataset}'):
+        print(f"Up to date: latency_comparison_{dataset}.{CHART_FORMAT}")
+        return
+
     # Get scenario names from first backend
     scenarios = dataset_data[0].scenarios if dataset_data else []
     if not scenarios:
         return
-    
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    x = np.arange(len(scenarios))
-    width = 0.2
-    multiplier = 0
-    
+
+    fig, ax = _reusable_axes(1, 1, (14, 8))
+
+    # Sort once into BACKENDS order for a stable legend, then index the
+    # precomputed label/color tuples instead of per-backend dict lookups.
+    # Pandas lays out the grouped bars internally; no offset bookkeeping
+    dataset_data = sorted(dataset_data, key=lambda d: BACKENDS.index(d.backend))
+    series = {}
+    colors = []
     for data in dataset_data:
-        if len(data.p50_latencies) != len(scenarios):
+        p50 = data.latencies[:, 0]
+        if len(p50) != len(scenarios):
             continue
-        
-        offset = width * multiplier
-        bars = ax.bar(x + offset, data.p50_latencies, width,
-                     label=BACKEND_LABELS.get(data.backend, data.backend),
-                     color=BACKEND_COLORS.get(data.backend, '#666666'))
-        
-        # Add value labels on bars
-        for bar, val in zip(bars, data.p50_latencies):
-            height = bar.get_height()
-            ax.annotate(f'{val:.1f}',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom', fontsize=8)
-        
-        multiplier += 1
-    
+        bi = BACKENDS.index(data.backend)
+        series[BACKEND_LABEL_TUPLE[bi]] = p50
+        colors.append(BACKEND_COLOR_TUPLE[bi])
+
+    df = pd.DataFrame(series, index=scenarios)
+    df.plot.bar(ax=ax, color=colors, width=0.8, rot=45)
+
+    # Add value labels on bars in one batched layout pass per series
+    for bars in ax.containers:
+        ax.bar_label(bars, fmt='%.1f', padding=3, fontsize=8)
+
     ax.set_ylabel('Latency (ms)', fontsize=12)
     ax.set_xlabel('Benchmark Scenarios', fontsize=12)
     ax.set_title(f'P50 Latency Comparison - {dataset.title()} Dataset', fontsize=14, fontweight='bold')
-    ax.set_xticks(x + width * (len(dataset_data) - 1) / 2)
-    ax.set_xticklabels(scenarios, rotation=45, ha='right')
+    plt.setp(ax.get_xticklabels(), ha='right')
     ax.legend(loc='upper right')
     ax.grid(axis='y', alpha=0.3)
-    
-    plt.tight_layout()
-    
-    output_path = output_dir / f'latency_comparison_{dataset}.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved: {output_path}")
 
 
-def create_chunk_improvement_chart(data_list: List[BenchmarkData], dataset: str, output_dir: Path):
+    _save_chart(fig, output_dir, f'latency_comparison_{dataset}')
+
+
+def create_chunk_improvement_chart(dataset_data: List[BenchmarkData], dataset: str, output_dir: Path):
     """Create chart showing chunk improvement percentages."""
-    if not HAS_MATPLOTLIB:
+    if not HAS_MATPLOTLIB or not HAS_PANDAS:
         return
-    
-    dataset_data = [d for d in data_list if d.dataset == dataset]
+
     if not dataset_data:
         return
-    
+
+    if _is_fresh(output_dir, f'chunk_improvement_{dataset}'):
+        print(f"Up to date: chunk_improvement_{dataset}.{CHART_FORMAT}")
+        return
+
     scenarios = dataset_data[0].scenarios if dataset_data else []
     if not scenarios:
         return
-    
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    x = np.arange(len(scenarios))
-    width = 0.2
-    multiplier = 0
-    
+
+    fig, ax = _reusable_axes(1, 1, (14, 8))
+
+    # Sort once into BACKENDS order for a stable legend, then index the
+    # precomputed label/color tuples instead of per-backend dict lookups.
+    # Pandas lays out the grouped bars internally; no offset bookkeeping
+    dataset_data = sorted(dataset_data, key=lambda d: BACKENDS.index(d.backend))
+    series = {}
+    colors = []
     for data in dataset_data:
         if len(data.chunk_improvements) != len(scenarios):
             continue
-        
-        offset = width * multiplier
-        bars = ax.bar(x + offset, data.chunk_improvements, width,
-                     label=BACKEND_LABELS.get(data.backend, data.backend),
-                     color=BACKEND_COLORS.get(data.backend, '#666666'))
-        
-        multiplier += 1
-    
+        bi = BACKENDS.index(data.backend)
+        series[BACKEND_LABEL_TUPLE[bi]] = data.chunk_improvements
+        colors.append(BACKEND_COLOR_TUPLE[bi])
+
+    df = pd.DataFrame(series, index=scenarios)
+    df.plot.bar(ax=ax, color=colors, width=0.8, rot=45)
+
     ax.set_ylabel('Chunk Improvement (%)', fontsize=12)
     ax.set_xlabel('Benchmark Scenarios', fontsize=12)
     ax.set_title(f'Context Chunk Savings - {dataset.title()} Dataset', fontsize=14, fontweight='bold')
-    ax.set_xticks(x + width * (len(dataset_data) - 1) / 2)
-    ax.set_xticklabels(scenarios, rotation=45, ha='right')
+    plt.setp(ax.get_xticklabels(), ha='right')
     ax.legend(loc='upper right')
     ax.grid(axis='y', alpha=0.3)
     ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
     
-    plt.tight_layout()
-    
-    output_path = output_dir / f'chunk_improvement_{dataset}.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved: {output_path}")
+    _save_chart(fig, output_dir, f'chunk_improvement_{dataset}')
 
 
-def create_latency_percentile_chart(data_list: List[BenchmarkData], output_dir: Path):
+def create_latency_percentile_chart(by_dataset: Dict[str, List[BenchmarkData]], output_dir: Path):
     """Create chart showing P50/P95/P99 latency percentiles per backend."""
     if not HAS_MATPLOTLIB:
         return
-    
-    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
-    
+
+    if _is_fresh(output_dir, 'latency_percentiles_all'):
+        print(f"Up to date: latency_percentiles_all.{CHART_FORMAT}")
+        return
+
+    fig, axes = _reusable_axes(1, 2, (16, 6))
+
     for ax, dataset in zip(axes, DATASETS):
-        dataset_data = [d for d in data_list if d.dataset == dataset]
+        dataset_data = by_dataset.get(dataset, [])
         if not dataset_data:
             continue
         
-        backends = []
-        p50_means = []
-        p95_means = []
-        p99_means = []
-        
-        for data in dataset_data:
-            backends.append(data.backend)
-            p50_means.append(np.mean(data.p50_latencies) if data.p50_latencies else 0)
-            p95_means.append(np.mean(data.p95_latencies) if data.p95_latencies else 0)
-            p99_means.append(np.mean(data.p99_latencies) if data.p99_latencies else 0)
-        
-        x = np.arange(len(backends))
+        # Sort once into BACKENDS order so ticks line up with the label tuple
+        dataset_data = sorted(dataset_data, key=lambda d: BACKENDS.index(d.backend))
+        order = [BACKENDS.index(data.backend) for data in dataset_data]
+        # One (n_backends, 3) matrix of per-backend percentile means
+        means = np.stack([data.latency_means for data in dataset_data])
+
+        x = _arange(len(order))
         width = 0.25
-        
-        bars1 = ax.bar(x - width, p50_means, width, label='P50', color='#4CAF50')
-        bars2 = ax.bar(x, p95_means, width, label='P95', color='#FF9800')
-        bars3 = ax.bar(x + width, p99_means, width, label='P99', color='#F44336')
+
+        bars1 = ax.bar(x - width, means[:, 0], width, label='P50', color='#4CAF50')
+        bars2 = ax.bar(x, means[:, 1], width, label='P95', color='#FF9800')
+        bars3 = ax.bar(x + width, means[:, 2], width, label='P99', color='#F44336')
         
         ax.set_ylabel('Average Latency (ms)', fontsize=11)
         ax.set_xlabel('Backend', fontsize=11)
         ax.set_title(f'Latency Percentiles - {dataset.title()} Dataset', fontsize=12, fontweight='bold')
         ax.set_xticks(x)
-        ax.set_xticklabels([BACKEND_LABELS.get(b, b) for b in backends], rotation=30, ha='right')
+        ax.set_xticklabels([BACKEND_LABEL_TUPLE[i] for i in order], rotation=30, ha='right')
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    
-    output_path = output_dir / 'latency_percentiles_all.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved: {output_path}")
+    _save_chart(fig, output_dir, 'latency_percentiles_all')
 
 
-def create_overhead_comparison_chart(data_list: List[BenchmarkData], output_dir: Path):
+def create_overhead_comparison_chart(idx: Dict[Tuple[str, str], BenchmarkData], output_dir: Path):
     """Create chart comparing latency overhead across backends."""
     if not HAS_MATPLOTLIB:
         return
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    # Group data by dataset
-    data_by_dataset = {ds: [] for ds in DATASETS}
-    for data in data_list:
-        data_by_dataset[data.dataset].append(data)
-    
-    x = np.arange(len(BACKENDS))
+
+    if _is_fresh(output_dir, 'overhead_comparison'):
+        print(f"Up to date: overhead_comparison.{CHART_FORMAT}")
+        return
+
+    fig, ax = _reusable_axes(1, 1, (12, 6))
+
+    x = _arange(len(BACKENDS))
     width = 0.35
-    
+
     colors = {'medical': '#2196F3', 'sap': '#FF9800'}
-    
-    for i, (dataset, dataset_data) in enumerate(data_by_dataset.items()):
+
+    for i, dataset in enumerate(DATASETS):
         overheads = []
         for backend in BACKENDS:
-            backend_data = next((d for d in dataset_data if d.backend == backend), None)
-            if backend_data and backend_data.latency_overheads:
-                overheads.append(np.mean(backend_data.latency_overheads))
-            else:
-                overheads.append(0)
+            backend_data = idx.get((backend, dataset))
+            overheads.append(backend_data.overhead_mean if backend_data is not None else 0)
         
         offset = (i - 0.5) * width
         bars = ax.bar(x + offset, overheads, width, label=f'{dataset.title()} Dataset',
@@ -298,114 +402,93 @@ def create_overhead_comparison_chart(data_list: List[BenchmarkData], output_dir:
     ax.set_xlabel('Backend', fontsize=12)
     ax.set_title('CEF Latency Overhead by Backend', fontsize=14, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels([BACKEND_LABELS.get(b, b) for b in BACKENDS], rotation=30, ha='right')
+    ax.set_xticklabels(BACKEND_LABEL_TUPLE, rotation=30, ha='right')
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
     ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
     
-    plt.tight_layout()
-    
-    output_path = output_dir / 'overhead_comparison.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved: {output_path}")
+    _save_chart(fig, output_dir, 'overhead_comparison')
 
 
-def create_summary_dashboard(data_list: List[BenchmarkData], output_dir: Path):
+def create_summary_dashboard(by_backend: Dict[str, List[BenchmarkData]], output_dir: Path):
     """Create a summary dashboard with multiple metrics."""
     if not HAS_MATPLOTLIB:
         return
-    
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    
-    # Top-left: Average P50 latency per backend
-    ax = axes[0, 0]
+
+    if _is_fresh(output_dir, 'benchmark_dashboard'):
+        print(f"Up to date: benchmark_dashboard.{CHART_FORMAT}")
+        return
+
+    fig, axes = _reusable_axes(2, 2, (16, 12))
+
+    # Single pass over the grouped data: per-backend means of p50 latency,
+    # chunk improvement and latency overhead as a (n_backends, 3) matrix
     backends = []
-    p50_avgs = []
     colors = []
-    
-    for backend in BACKENDS:
-        backend_data = [d for d in data_list if d.backend == backend]
-        if backend_data:
-            all_p50 = []
-            for d in backend_data:
-                all_p50.extend(d.p50_latencies)
-            backends.append(BACKEND_LABELS.get(backend, backend))
-            p50_avgs.append(np.mean(all_p50) if all_p50 else 0)
-            colors.append(BACKEND_COLORS.get(backend, '#666666'))
-    
-    ax.barh(backends, p50_avgs, color=colors)
+    rows = []
+    for backend, label, color in zip(BACKENDS, BACKEND_LABEL_TUPLE, BACKEND_COLOR_TUPLE):
+        backend_data = by_backend.get(backend, [])
+        if not backend_data:
+            continue
+        all_p50 = np.concatenate([d.latencies[:, 0] for d in backend_data])
+        all_improvements = np.concatenate([d.chunk_improvements for d in backend_data])
+        all_overheads = np.concatenate([d.latency_overheads for d in backend_data])
+        backends.append(label)
+        colors.append(color)
+        rows.append((all_p50.mean() if all_p50.size else 0,
+                     all_improvements.mean() if all_improvements.size else 0,
+                     all_overheads.mean() if all_overheads.size else 0))
+    M = np.array(rows, dtype=np.float64).reshape(len(rows), 3)
+
+    # Top-left: Average P50 latency per backend
+    ax = axes[0, 0]
+    ax.barh(backends, M[:, 0], color=colors)
     ax.set_xlabel('Average P50 Latency (ms)', fontsize=11)
     ax.set_title('Average Query Latency by Backend', fontsize=12, fontweight='bold')
     ax.grid(axis='x', alpha=0.3)
-    
+
     # Top-right: Average chunk improvement per backend
     ax = axes[0, 1]
-    backends = []
-    improvements = []
-    colors = []
-    
-    for backend in BACKENDS:
-        backend_data = [d for d in data_list if d.backend == backend]
-        if backend_data:
-            all_improvements = []
-            for d in backend_data:
-                all_improvements.extend(d.chunk_improvements)
-            backends.append(BACKEND_LABELS.get(backend, backend))
-            improvements.append(np.mean(all_improvements) if all_improvements else 0)
-            colors.append(BACKEND_COLORS.get(backend, '#666666'))
-    
-    ax.barh(backends, improvements, color=colors)
+    ax.barh(backends, M[:, 1], color=colors)
     ax.set_xlabel('Average Chunk Improvement (%)', fontsize=11)
     ax.set_title('Context Optimization Effectiveness', fontsize=12, fontweight='bold')
     ax.grid(axis='x', alpha=0.3)
     ax.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
-    
+
     # Bottom-left: Latency overhead comparison
     ax = axes[1, 0]
-    backends = []
-    overheads = []
-    colors = []
-    
-    for backend in BACKENDS:
-        backend_data = [d for d in data_list if d.backend == backend]
-        if backend_data:
-            all_overheads = []
-            for d in backend_data:
-                all_overheads.extend(d.latency_overheads)
-            backends.append(BACKEND_LABELS.get(backend, backend))
-            overheads.append(np.mean(all_overheads) if all_overheads else 0)
-            colors.append(BACKEND_COLORS.get(backend, '#666666'))
-    
-    ax.barh(backends, overheads, color=colors)
+    ax.barh(backends, M[:, 2], color=colors)
     ax.set_xlabel('Average Latency Overhead (%)', fontsize=11)
     ax.set_title('CEF Processing Overhead', fontsize=12, fontweight='bold')
     ax.grid(axis='x', alpha=0.3)
     ax.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
-    
+
     # Bottom-right: Scenario count per backend
     ax = axes[1, 1]
     backend_scenario_counts = {}
-    for data in data_list:
-        key = BACKEND_LABELS.get(data.backend, data.backend)
-        if key not in backend_scenario_counts:
-            backend_scenario_counts[key] = 0
-        backend_scenario_counts[key] += len(data.scenarios)
+    for backend, backend_data in by_backend.items():
+        key = BACKEND_LABELS.get(backend, backend)
+        backend_scenario_counts[key] = sum(len(d.scenarios) for d in backend_data)
     
     if backend_scenario_counts:
         ax.pie(list(backend_scenario_counts.values()),
                labels=list(backend_scenario_counts.keys()),
                autopct='%1.1f%%',
-               colors=[BACKEND_COLORS.get(b, '#666666') for b in BACKENDS if BACKEND_LABELS.get(b, b) in backend_scenario_counts])
+               colors=[c for lbl, c in zip(BACKEND_LABEL_TUPLE, BACKEND_COLOR_TUPLE)
+                       if lbl in backend_scenario_counts])
         ax.set_title('Scenarios Executed by Backend', fontsize=12, fontweight='bold')
     
-    plt.suptitle('CEF Benchmark Summary Dashboard', fontsize=16, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    
-    output_path = output_dir / 'benchmark_dashboard.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved: {output_path}")
+    fig.suptitle('CEF Benchmark Summary Dashboard', fontsize=16, fontweight='bold')
+
+    _save_chart(fig, output_dir, 'benchmark_dashboard')
+
+
+def _render_task(task):
+    """Run one picklable (chart_fn, args, settings) task in a worker process."""
+    global CHART_FORMAT, INPUT_MTIME, FORCE
+    _lazy_imports()  # no-op under fork, needed when workers are spawned fresh
+    fn, args, (CHART_FORMAT, INPUT_MTIME, FORCE) = task
+    fn(*args)
 
 
 def main():
@@ -424,21 +507,33 @@ def main():
         default=DEFAULT_OUTPUT_DIR,
         help='Output directory for charts'
     )
-    
+    parser.add_argument(
+        '--raster',
+        action='store_true',
+        help='Emit 150 dpi PNG instead of the default SVG'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate charts even when they are newer than the inputs'
+    )
+
     args = parser.parse_args()
     
     if not HAS_MATPLOTLIB:
         print("Error: matplotlib is required for visualization")
         print("Install with: pip install matplotlib")
         sys.exit(1)
-    
+
     results_dir = Path(args.results_dir)
     output_dir = Path(args.output_dir)
-    
+
     if not results_dir.exists():
         print(f"Error: Results directory not found: {results_dir}")
         sys.exit(1)
-    
+
+    _lazy_imports()
+
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -446,24 +541,38 @@ def main():
     print(f"Saving charts to: {output_dir}")
     
     # Load data
-    data_list = load_benchmark_data(results_dir)
+    data_list, input_mtime = load_benchmark_data(results_dir)
     
     if not data_list:
         print("No benchmark data found!")
         sys.exit(1)
     
     print(f"Found {len(data_list)} benchmark result sets")
-    
-    # Generate charts
+
+    # Index once so no chart function has to rescan data_list
+    idx = {(d.backend, d.dataset): d for d in data_list}
+    by_dataset = defaultdict(list)
+    by_backend = defaultdict(list)
+    for d in data_list:
+        by_dataset[d.dataset].append(d)
+        by_backend[d.backend].append(d)
+
+    # Generate charts. Rasterization is CPU-bound, so the independent chart
+    # tasks are dispatched to a process pool (Agg is forced at import, so
+    # workers never try to initialize a display).
     print("\nGenerating charts...")
-    
+
+    settings = ('png' if args.raster else 'svg', input_mtime, args.force)
+    tasks = []
     for dataset in DATASETS:
-        create_latency_comparison_chart(data_list, dataset, output_dir)
-        create_chunk_improvement_chart(data_list, dataset, output_dir)
-    
-    create_latency_percentile_chart(data_list, output_dir)
-    create_overhead_comparison_chart(data_list, output_dir)
-    create_summary_dashboard(data_list, output_dir)
+        tasks.append((create_latency_comparison_chart, (by_dataset[dataset], dataset, output_dir), settings))
+        tasks.append((create_chunk_improvement_chart, (by_dataset[dataset], dataset, output_dir), settings))
+    tasks.append((create_latency_percentile_chart, (dict(by_dataset), output_dir), settings))
+    tasks.append((create_overhead_comparison_chart, (idx, output_dir), settings))
+    tasks.append((create_summary_dashboard, (dict(by_backend), output_dir), settings))
+
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_render_task, tasks))
     
     print("\nVisualization complete!")
     print(f"Charts saved to: {output_dir}")